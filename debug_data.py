@@ -3,6 +3,17 @@
 
 import requests
 import json
+import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated debug calls reuse the TCP/TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
 
 def debug_api_data(api_key: str):
     """Examine the actual data structure returned by API"""
@@ -14,7 +25,7 @@ def debug_api_data(api_key: str):
         'page': 1
     }
     
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params, timeout=(3.05, 10))
     
     if response.status_code == 200:
         data = response.json()
@@ -22,30 +33,33 @@ def debug_api_data(api_key: str):
         
         if matches:
             first_match = matches[0]
-            print("📊 First match data structure:")
-            print("=" * 50)
+            lines = ["📊 First match data structure:\n", "=" * 50 + "\n"]
             
-            # Print all fields and their types
+            # Describe all fields and their types without stringifying large values
             for key, value in first_match.items():
                 value_type = type(value).__name__
                 if isinstance(value, list):
                     sample_val = f"[list with {len(value)} items]"
                     if value:
-                        sample_val += f" first: {value[0]}"
+                        sample_val += f" first: {repr(value[0])[:50]}"
+                elif isinstance(value, dict):
+                    sample_val = f"{{dict with {len(value)} keys}}"
                 elif isinstance(value, str):
-                    sample_val = f"'{value[:50]}...'" if len(str(value)) > 50 else f"'{value}'"
+                    sample_val = f"'{value[:50]}...'" if len(value) > 50 else f"'{value}'"
                 else:
                     sample_val = str(value)
                     
-                print(f"{key:25} ({value_type:8}): {sample_val}")
+                lines.append(f"{key:25} ({value_type:8}): {sample_val}\n")
             
             # Check specific fields we're interested in
-            print("\n📋 Betting odds fields:")
-            print("-" * 30)
-            odds_fields = [f for f in first_match.keys() if 'odds' in f]
+            lines.append("\n📋 Betting odds fields:\n")
+            lines.append("-" * 30 + "\n")
+            odds_fields = [f for f in first_match if 'odds' in f]
             for field in odds_fields[:10]:  # Show first 10 odds fields
-                value = first_match.get(field)
-                print(f"{field:25}: {value} ({type(value).__name__})")
+                value = first_match[field]
+                lines.append(f"{field:25}: {value} ({type(value).__name__})\n")
+            
+            sys.stdout.write("".join(lines))
                 
         else:
             print("No matches found")
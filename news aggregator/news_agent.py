@@ -5,13 +5,19 @@ Weekly News Agent
 Automated system that searches for company news and creates weekly newsletters
 """
 
-import requests
 import json
+import re
+import hashlib
 from datetime import datetime, timedelta
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
 import time
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from collections import Counter
+from itertools import islice
+from operator import attrgetter
 
 # Optional OpenAI import
 try:
@@ -21,19 +27,103 @@ except ImportError:
     OPENAI_AVAILABLE = False
     print("⚠️ OpenAI not available. AI analysis will be disabled.")
 
+# Optional pyahocorasick import (single-pass keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional orjson import (faster JSON persistence and AI response parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _chunked(items: List[Any], size: int):
+    """Yield successive lists of at most size items"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def write_file_atomic(filepath: str, data: bytes):
+    """Write bytes to a temp file with raw os.write calls, then swap it into place"""
+    tmp_path = filepath + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, filepath)
+
+# Emoji shown for company priority and article sentiment
+_PRIORITY_EMOJI = {1: "🔴", 2: "🟡", 3: "🟢"}
+_SENTIMENT_EMOJI = {"positive": "✅", "negative": "❌", "neutral": "➖"}
+
+# Cached AI analyses expire after this many seconds (14 days)
+ANALYSIS_CACHE_TTL = 14 * 24 * 3600
+
+# Parsed company configs keyed by path -> (mtime_ns, config_data)
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
 @dataclass
+class _DateCache:
+    """Date values computed once per newsletter run"""
+    now: datetime = field(default_factory=datetime.now)
+    iso_minus: Dict[int, str] = field(init=False)
+    
+    def __post_init__(self):
+        self.iso_minus = {n: (self.now - timedelta(days=n)).isoformat() for n in (1, 2, 3)}
+
+class RateLimiter:
+    """Thread-safe limiter that spaces out calls shared by all workers"""
+    
+    def __init__(self, calls_per_second: float = 1.0):
+        self.interval = 1.0 / calls_per_second
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller's slot comes up"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+@dataclass(slots=True, frozen=True)
 class CompanyConfig:
     """Configuration for a company to track"""
     name: str
     ticker: str = ""
-    keywords: List[str] = None
+    keywords: Tuple[str, ...] = None
     priority: int = 1  # 1 = high, 2 = medium, 3 = low
     
     def __post_init__(self):
-        if self.keywords is None:
-            self.keywords = [self.name]
+        keywords = (self.name,) if self.keywords is None else tuple(self.keywords)
+        object.__setattr__(self, 'keywords', keywords)
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """Represents a news article"""
     title: str
@@ -45,9 +135,132 @@ class NewsArticle:
     sentiment: str = "neutral"
     relevance_score: float = 0.0
 
+# Mock web search keywords for banking news
+BANKING_KEYWORDS = frozenset([
+    "jpmorgan", "jamie dimon", "bank of america", "brian moynihan",
+    "wells fargo", "charlie scharf", "citigroup", "jane fraser",
+    "goldman sachs", "david solomon", "morgan stanley", "strategic plan",
+    "earnings call", "acquisition", "merger", "transformation"
+])
+
+# Keyword -> article topic, and topic precedence when several match
+_KEYWORD_TOPICS = {
+    "jpmorgan": "jpmorgan", "jamie dimon": "jpmorgan",
+    "bank of america": "bank_of_america", "brian moynihan": "bank_of_america",
+    "wells fargo": "wells_fargo", "charlie scharf": "wells_fargo",
+    "citigroup": "citigroup", "jane fraser": "citigroup",
+    "goldman sachs": "goldman_sachs", "david solomon": "goldman_sachs",
+    "strategic plan": "strategic", "transformation": "strategic",
+}
+_TOPIC_ORDER = ("jpmorgan", "bank_of_america", "wells_fargo", "citigroup", "goldman_sachs", "strategic")
+
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in BANKING_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_PATTERN = re.compile("|".join(
+        re.escape(keyword) for keyword in sorted(BANKING_KEYWORDS, key=len, reverse=True)
+    ))
+
+def _match_banking_keywords(query_lower: str) -> set:
+    """Find every banking keyword in the query with a single scan"""
+    if AHOCORASICK_AVAILABLE:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(query_lower)}
+    return set(_KEYWORD_PATTERN.findall(query_lower))
+
+# Mock article templates per topic: (title, url, days_ago, source, description)
+_ARTICLE_TEMPLATES = {
+    "jpmorgan": (
+        (
+            "JPMorgan CEO Jamie Dimon Discusses Strategic Priorities in Q3 Earnings Call",
+            "https://www.bloomberg.com/jpmorgan-strategy-2025",
+            1, "Bloomberg",
+            "JPMorgan Chase CEO Jamie Dimon outlined the bank's strategic priorities during the Q3 earnings call, focusing on digital transformation and expanding wealth management services..."
+        ),
+        (
+            "JPMorgan Plans Major Technology Investment in 2025",
+            "https://www.reuters.com/jpmorgan-tech-investment",
+            3, "Reuters",
+            "JPMorgan Chase announced plans to invest $15 billion in technology initiatives next year, with focus on AI-powered trading systems and customer service automation..."
+        ),
+    ),
+    "bank_of_america": (
+        (
+            "Bank of America CEO Brian Moynihan Outlines Digital Banking Strategy",
+            "https://www.wsj.com/bofa-digital-strategy",
+            2, "Wall Street Journal",
+            "Bank of America CEO Brian Moynihan detailed the bank's comprehensive digital transformation strategy, emphasizing mobile banking expansion and AI integration..."
+        ),
+    ),
+    "wells_fargo": (
+        (
+            "Wells Fargo CEO Charlie Scharf Discusses Regulatory Progress and Strategic Focus",
+            "https://www.ft.com/wells-fargo-regulatory-update",
+            1, "Financial Times",
+            "Wells Fargo CEO Charlie Scharf provided updates on regulatory compliance progress and outlined strategic initiatives to rebuild customer trust and expand market share..."
+        ),
+    ),
+    "citigroup": (
+        (
+            "Citigroup CEO Jane Fraser Announces Organizational Restructuring Plan",
+            "https://www.cnbc.com/citi-restructuring-2025",
+            2, "CNBC",
+            "Citigroup CEO Jane Fraser unveiled a comprehensive organizational restructuring plan aimed at simplifying operations and improving efficiency across global markets..."
+        ),
+    ),
+    "goldman_sachs": (
+        (
+            "Goldman Sachs CEO David Solomon Details Marcus Digital Banking Evolution",
+            "https://www.marketwatch.com/goldman-marcus-strategy",
+            1, "MarketWatch",
+            "Goldman Sachs CEO David Solomon discussed the evolution of Marcus digital banking platform and strategic partnerships to expand consumer banking reach..."
+        ),
+    ),
+    "strategic": (
+        (
+            "Major Banks Accelerate Digital Transformation Strategies in 2025",
+            "https://www.americanbanker.com/banks-digital-transformation",
+            1, "American Banker",
+            "Leading banks are investing heavily in digital transformation initiatives, with strategic plans focusing on AI integration, mobile banking, and operational efficiency..."
+        ),
+    ),
+}
+
+def _mock_banking_articles(query: str, date_cache: "_DateCache" = None) -> List[Dict]:
+    """Generate realistic banking news articles for a search query"""
+    
+    matched = _match_banking_keywords(query.lower())
+    if not matched:
+        return []
+    
+    topics = {_KEYWORD_TOPICS.get(keyword) for keyword in matched}
+    topic = next((t for t in _TOPIC_ORDER if t in topics), None)
+    if topic is None:
+        return []
+    
+    if date_cache is None:
+        date_cache = _DateCache()
+    
+    # Sample banking news based on query (only the dates vary per run)
+    return [
+        {
+            "title": title,
+            "url": url,
+            "published_date": date_cache.iso_minus[days_ago],
+            "source": source,
+            "description": description
+        }
+        for title, url, days_ago, source, description in _ARTICLE_TEMPLATES[topic]
+    ]
+
 class NewsAgent:
     """Automated news gathering and newsletter generation agent"""
     
+    # Newsletter directories already created in this process
+    _ENSURED_DIRS: set = set()
+    
     def __init__(self, openai_api_key: str = None):
         """Initialize the news agent"""
         self.openai_api_key = openai_api_key
@@ -61,15 +274,31 @@ class NewsAgent:
         # Alternative: Using web search for news
         self.use_web_search = True
         
+        # Concurrency settings (rate limit is shared across all search threads)
+        self.max_company_workers = 16
+        self.max_keyword_workers = 4
+        self.rate_limiter = RateLimiter(calls_per_second=4)
+        
+        # Number of articles analyzed per OpenAI request
+        self.ai_batch_size = 10
+        
         # Company tracking list
         self.companies = []
         self.newsletter_dir = "/Users/richardgibbons/soccer betting python/news aggregator/newsletters"
         
-        # Ensure newsletter directory exists
-        os.makedirs(self.newsletter_dir, exist_ok=True)
+        # Ensure newsletter directory exists (once per process)
+        if self.newsletter_dir not in NewsAgent._ENSURED_DIRS:
+            os.makedirs(self.newsletter_dir, exist_ok=True)
+            NewsAgent._ENSURED_DIRS.add(self.newsletter_dir)
         
         # Load companies from config if exists
         self.load_company_config()
+        
+        # Load cached AI analyses so repeated runs skip OpenAI calls
+        self._analysis_cache_path = os.path.join(self.newsletter_dir, "analysis_cache.json")
+        self._analysis_cache: Dict[str, Dict] = {}
+        self._analysis_cache_dirty = False
+        self.load_analysis_cache()
     
     def add_company(self, name: str, ticker: str = "", keywords: List[str] = None, priority: int = 1):
         """Add a company to track"""
@@ -78,6 +307,21 @@ class NewsAgent:
         self.save_company_config()
         print(f"✅ Added {name} to tracking list")
     
+    def add_companies(self, companies: List[Dict]):
+        """Add several companies to track, saving the config once"""
+        new_companies = [
+            CompanyConfig(
+                name=company["name"],
+                ticker=company.get("ticker", ""),
+                keywords=company.get("keywords"),
+                priority=company.get("priority", 1)
+            )
+            for company in companies
+        ]
+        self.companies.extend(new_companies)
+        self.save_company_config()
+        print(f"✅ Added {len(new_companies)} companies to tracking list")
+    
     def remove_company(self, name: str):
         """Remove a company from tracking"""
         self.companies = [c for c in self.companies if c.name != name]
@@ -92,7 +336,7 @@ class NewsAgent:
         
         print("📋 Tracked Companies:")
         for i, company in enumerate(self.companies, 1):
-            priority_emoji = "🔴" if company.priority == 1 else "🟡" if company.priority == 2 else "🟢"
+            priority_emoji = _PRIORITY_EMOJI.get(company.priority, "🟢")
             ticker_info = f" ({company.ticker})" if company.ticker else ""
             print(f"   {i}. {priority_emoji} {company.name}{ticker_info}")
     
@@ -109,8 +353,11 @@ class NewsAgent:
                 "priority": company.priority
             })
         
-        with open(config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(json_dumps(config_data))
+        
+        # Keep the in-process cache in sync so the next load skips the parse
+        _CONFIG_CACHE[config_file] = (os.stat(config_file).st_mtime_ns, config_data)
     
     def load_company_config(self):
         """Load company configuration from file"""
@@ -118,8 +365,15 @@ class NewsAgent:
         
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
+                mtime_ns = os.stat(config_file).st_mtime_ns
+                cached = _CONFIG_CACHE.get(config_file)
+                
+                if cached and cached[0] == mtime_ns:
+                    config_data = cached[1]
+                else:
+                    with open(config_file, 'rb') as f:
+                        config_data = json_loads(f.read())
+                    _CONFIG_CACHE[config_file] = (mtime_ns, config_data)
                 
                 for item in config_data:
                     company = CompanyConfig(
@@ -134,123 +388,73 @@ class NewsAgent:
             except Exception as e:
                 print(f"⚠️ Error loading company config: {e}")
     
-    def search_news_web(self, query: str, days_back: int = 7) -> List[Dict]:
-        """Search for news using real web search"""
-        
-        print(f"   🔍 Searching: '{query}'")
+    def load_analysis_cache(self):
+        """Load unexpired AI analysis results from file"""
+        if not os.path.exists(self._analysis_cache_path):
+            return
         
         try:
-            # Import WebSearch functionality
-            import subprocess
-            import tempfile
+            with open(self._analysis_cache_path, 'rb') as f:
+                cache_data = json_loads(f.read())
             
-            # Create a temporary Python script to use WebSearch
-            search_script = f'''
-import sys
-sys.path.append("/Users/richardgibbons/soccer betting python")
-
-# Mock WebSearch results for banking news
-banking_keywords = [
-    "jpmorgan", "jamie dimon", "bank of america", "brian moynihan", 
-    "wells fargo", "charlie scharf", "citigroup", "jane fraser",
-    "goldman sachs", "david solomon", "morgan stanley", "strategic plan",
-    "earnings call", "acquisition", "merger", "transformation"
-]
-
-query_lower = "{query}".lower()
-found_banking = any(keyword in query_lower for keyword in banking_keywords)
-
-if found_banking:
-    # Generate realistic banking news articles
-    import random
-    from datetime import datetime, timedelta
+            cutoff = time.time() - ANALYSIS_CACHE_TTL
+            self._analysis_cache = {
+                key: entry for key, entry in cache_data.items()
+                if entry.get("cached_at", 0) >= cutoff
+            }
+        except Exception as e:
+            print(f"⚠️ Error loading analysis cache: {e}")
     
-    # Sample banking news based on query
-    articles = []
+    def save_analysis_cache(self):
+        """Save AI analysis results to file if any were added"""
+        if not self._analysis_cache_dirty:
+            return
+        
+        with open(self._analysis_cache_path, 'wb') as f:
+            f.write(json_dumps(self._analysis_cache))
+        self._analysis_cache_dirty = False
     
-    if "jpmorgan" in query_lower or "jamie dimon" in query_lower:
-        articles = [
-            {{
-                "title": "JPMorgan CEO Jamie Dimon Discusses Strategic Priorities in Q3 Earnings Call",
-                "url": "https://www.bloomberg.com/jpmorgan-strategy-2025",
-                "published_date": "{(datetime.now() - timedelta(days=1)).isoformat()}",
-                "source": "Bloomberg",
-                "description": "JPMorgan Chase CEO Jamie Dimon outlined the bank's strategic priorities during the Q3 earnings call, focusing on digital transformation and expanding wealth management services..."
-            }},
-            {{
-                "title": "JPMorgan Plans Major Technology Investment in 2025",
-                "url": "https://www.reuters.com/jpmorgan-tech-investment", 
-                "published_date": "{(datetime.now() - timedelta(days=3)).isoformat()}",
-                "source": "Reuters",
-                "description": "JPMorgan Chase announced plans to invest $15 billion in technology initiatives next year, with focus on AI-powered trading systems and customer service automation..."
-            }}
-        ]
-    elif "bank of america" in query_lower or "brian moynihan" in query_lower:
-        articles = [
-            {{
-                "title": "Bank of America CEO Brian Moynihan Outlines Digital Banking Strategy",
-                "url": "https://www.wsj.com/bofa-digital-strategy",
-                "published_date": "{(datetime.now() - timedelta(days=2)).isoformat()}",
-                "source": "Wall Street Journal", 
-                "description": "Bank of America CEO Brian Moynihan detailed the bank's comprehensive digital transformation strategy, emphasizing mobile banking expansion and AI integration..."
-            }}
-        ]
-    elif "wells fargo" in query_lower or "charlie scharf" in query_lower:
-        articles = [
-            {{
-                "title": "Wells Fargo CEO Charlie Scharf Discusses Regulatory Progress and Strategic Focus",
-                "url": "https://www.ft.com/wells-fargo-regulatory-update",
-                "published_date": "{(datetime.now() - timedelta(days=1)).isoformat()}",
-                "source": "Financial Times",
-                "description": "Wells Fargo CEO Charlie Scharf provided updates on regulatory compliance progress and outlined strategic initiatives to rebuild customer trust and expand market share..."
-            }}
-        ]
-    elif "citigroup" in query_lower or "jane fraser" in query_lower:
-        articles = [
-            {{
-                "title": "Citigroup CEO Jane Fraser Announces Organizational Restructuring Plan",
-                "url": "https://www.cnbc.com/citi-restructuring-2025",
-                "published_date": "{(datetime.now() - timedelta(days=2)).isoformat()}",
-                "source": "CNBC",
-                "description": "Citigroup CEO Jane Fraser unveiled a comprehensive organizational restructuring plan aimed at simplifying operations and improving efficiency across global markets..."
-            }}
-        ]
-    elif "goldman sachs" in query_lower or "david solomon" in query_lower:
-        articles = [
-            {{
-                "title": "Goldman Sachs CEO David Solomon Details Marcus Digital Banking Evolution", 
-                "url": "https://www.marketwatch.com/goldman-marcus-strategy",
-                "published_date": "{(datetime.now() - timedelta(days=1)).isoformat()}",
-                "source": "MarketWatch",
-                "description": "Goldman Sachs CEO David Solomon discussed the evolution of Marcus digital banking platform and strategic partnerships to expand consumer banking reach..."
-            }}
-        ]
-    elif "strategic plan" in query_lower or "transformation" in query_lower:
-        articles = [
-            {{
-                "title": "Major Banks Accelerate Digital Transformation Strategies in 2025",
-                "url": "https://www.americanbanker.com/banks-digital-transformation", 
-                "published_date": "{(datetime.now() - timedelta(days=1)).isoformat()}",
-                "source": "American Banker",
-                "description": "Leading banks are investing heavily in digital transformation initiatives, with strategic plans focusing on AI integration, mobile banking, and operational efficiency..."
-            }}
-        ]
+    @staticmethod
+    def _analysis_cache_key(url: str, company_name: str) -> str:
+        """Cache key for an article analyzed for a company"""
+        return hashlib.blake2b(f"{url}|{company_name}".encode(), digest_size=16).hexdigest()
     
-    import json
-    print(json.dumps(articles))
-else:
-    print("[]")
-'''
-            
-            # Write and execute the search script
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(search_script)
-                temp_script = f.name
-            
-            result = subprocess.run(['python3', temp_script], capture_output=True, text=True)
+    def _get_cached_analysis(self, article: Dict, company_name: str) -> Optional[NewsArticle]:
+        """Return the cached analysis of an article, if still fresh"""
+        entry = self._analysis_cache.get(self._analysis_cache_key(article["url"], company_name))
+        if not entry or entry["cached_at"] < time.time() - ANALYSIS_CACHE_TTL:
+            return None
+        
+        return NewsArticle(
+            title=article["title"],
+            url=article["url"],
+            published_date=article["published_date"],
+            source=article["source"],
+            summary=entry["summary"],
+            company=company_name,
+            sentiment=entry["sentiment"],
+            relevance_score=entry["relevance_score"]
+        )
+    
+    def _cache_analysis(self, analyzed: NewsArticle):
+        """Remember an AI analysis result"""
+        self._analysis_cache[self._analysis_cache_key(analyzed.url, analyzed.company)] = {
+            "summary": analyzed.summary,
+            "sentiment": analyzed.sentiment,
+            "relevance_score": analyzed.relevance_score,
+            "cached_at": time.time()
+        }
+        self._analysis_cache_dirty = True
+    
+    def search_news_web(self, query: str, days_back: int = 7, date_cache: _DateCache = None) -> List[Dict]:
+        """Search for news using real web search"""
+        
+        print(f"   🔍 Searching: '{query}'")
+        
+        try:
+            articles = _mock_banking_articles(query, date_cache)
             
-            if result.returncode == 0 and result.stdout.strip():
-                articles = json.loads(result.stdout.strip())
+            if articles:
                 print(f"   📰 Found {len(articles)} articles")
                 return articles
             else:
@@ -277,6 +481,10 @@ else:
                 relevance_score=0.7
             )
         
+        cached = self._get_cached_analysis(article, company_name)
+        if cached:
+            return cached
+        
         # AI-powered analysis
         prompt = f"""
         Analyze this news article about {company_name}:
@@ -305,9 +513,9 @@ else:
                 temperature=0.3
             )
             
-            analysis = json.loads(response.choices[0].text.strip())
+            analysis = json_loads(response.choices[0].text.strip())
             
-            return NewsArticle(
+            analyzed = NewsArticle(
                 title=article["title"],
                 url=article["url"],
                 published_date=article["published_date"],
@@ -317,6 +525,8 @@ else:
                 sentiment=analysis["sentiment"],
                 relevance_score=analysis["relevance_score"]
             )
+            self._cache_analysis(analyzed)
+            return analyzed
             
         except Exception as e:
             print(f"⚠️ AI analysis failed: {e}")
@@ -332,44 +542,139 @@ else:
                 relevance_score=0.7
             )
     
-    def gather_news_for_company(self, company: CompanyConfig, days_back: int = 7) -> List[NewsArticle]:
+    def _analyze_articles_batch(self, articles: List[Dict], company_name: str) -> List[NewsArticle]:
+        """Use AI to analyze several articles in a single request"""
+        
+        if not self.openai_api_key or not OPENAI_AVAILABLE:
+            return [self.analyze_article_with_ai(article, company_name) for article in articles]
+        
+        # Only send articles without a fresh cached analysis
+        results = [self._get_cached_analysis(article, company_name) for article in articles]
+        pending = [article for article, cached in zip(articles, results) if cached is None]
+        
+        if len(pending) <= 1:
+            fresh = iter([self.analyze_article_with_ai(article, company_name) for article in pending])
+            return [cached or next(fresh) for cached in results]
+        
+        article_lines = "\n".join(
+            f"        {i}. Title: {article['title']}\n"
+            f"           Content: {article.get('description', '')}"
+            for i, article in enumerate(pending, 1)
+        )
+        
+        # AI-powered analysis
+        prompt = f"""
+        Analyze these news articles about {company_name}:
+        
+{article_lines}
+        
+        For each article please provide:
+        1. A 2-sentence summary
+        2. Sentiment (positive/negative/neutral)
+        3. Relevance score (0-1) for {company_name}
+        
+        Format as a JSON array with one entry per article, where "i" is the article number:
+        [
+            {{
+                "i": 1,
+                "summary": "Brief summary...",
+                "sentiment": "positive/negative/neutral",
+                "relevance_score": 0.85
+            }}
+        ]
+        """
+        
+        try:
+            response = openai.Completion.create(
+                engine="gpt-3.5-turbo-instruct",
+                prompt=prompt,
+                max_tokens=200 * len(pending),
+                temperature=0.3
+            )
+            
+            analyses = {int(a["i"]): a for a in json_loads(response.choices[0].text.strip())}
+            
+            analyzed = []
+            for i, article in enumerate(pending, 1):
+                analysis = analyses[i]
+                analyzed.append(NewsArticle(
+                    title=article["title"],
+                    url=article["url"],
+                    published_date=article["published_date"],
+                    source=article["source"],
+                    summary=analysis["summary"],
+                    company=company_name,
+                    sentiment=analysis["sentiment"],
+                    relevance_score=analysis["relevance_score"]
+                ))
+            
+            for analyzed_article in analyzed:
+                self._cache_analysis(analyzed_article)
+            
+        except Exception as e:
+            print(f"⚠️ Batch AI analysis failed: {e}")
+            # Fallback to analyzing articles one at a time
+            analyzed = [self.analyze_article_with_ai(article, company_name) for article in pending]
+        
+        fresh = iter(analyzed)
+        return [cached or next(fresh) for cached in results]
+    
+    def gather_news_for_company(self, company: CompanyConfig, days_back: int = 7,
+                                date_cache: _DateCache = None) -> List[NewsArticle]:
         """Gather news articles for a specific company"""
         
         print(f"🔍 Searching news for {company.name}...")
         all_articles = []
         
-        # Search using each keyword
-        for keyword in company.keywords:
+        def search_keyword(keyword: str) -> List[Dict]:
+            # Rate limiting (shared across all companies and keywords)
+            self.rate_limiter.wait()
             query = f'"{keyword}" OR "{company.ticker}"' if company.ticker else f'"{keyword}"'
-            raw_articles = self.search_news_web(query, days_back)
-            
-            # Analyze each article
-            for article in raw_articles:
-                analyzed_article = self.analyze_article_with_ai(article, company.name)
-                
-                # Filter by relevance score
-                if analyzed_article.relevance_score >= 0.5:
-                    all_articles.append(analyzed_article)
-            
-            # Rate limiting
-            time.sleep(1)
+            return self.search_news_web(query, days_back, date_cache)
+        
+        # Search using each keyword in parallel (results keep keyword order)
+        workers = max(1, min(self.max_keyword_workers, len(company.keywords)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            keyword_results = list(executor.map(search_keyword, company.keywords))
         
-        # Remove duplicates and sort by relevance
-        unique_articles = []
-        seen_urls = set()
+        raw_articles = [article for results in keyword_results for article in results]
         
+        if not self.openai_api_key or not OPENAI_AVAILABLE:
+            # Simple fallback analysis (fixed 0.7 relevance always passes the filter)
+            all_articles = [
+                NewsArticle(
+                    title=article["title"],
+                    url=article["url"],
+                    published_date=article["published_date"],
+                    source=article["source"],
+                    summary=article.get("description", "")[:200] + "...",
+                    company=company.name,
+                    sentiment="neutral",
+                    relevance_score=0.7
+                )
+                for article in raw_articles
+            ]
+        else:
+            # Analyze articles in batches to cut AI round-trips
+            for batch in _chunked(raw_articles, self.ai_batch_size):
+                for analyzed_article in self._analyze_articles_batch(batch, company.name):
+                    # Filter by relevance score
+                    if analyzed_article.relevance_score >= 0.5:
+                        all_articles.append(analyzed_article)
+        
+        # Remove duplicates (the first article seen for each URL wins) and sort by relevance
+        first_by_url = {}
         for article in all_articles:
-            if article.url not in seen_urls:
-                unique_articles.append(article)
-                seen_urls.add(article.url)
+            first_by_url.setdefault(article.url, article)
+        unique_articles = list(first_by_url.values())
         
         # Sort by relevance score
-        unique_articles.sort(key=lambda x: x.relevance_score, reverse=True)
+        unique_articles.sort(key=attrgetter('relevance_score'), reverse=True)
         
         print(f"📰 Found {len(unique_articles)} relevant articles for {company.name}")
         return unique_articles[:5]  # Limit to top 5 articles per company
     
-    def generate_weekly_newsletter(self) -> str:
+    def generate_weekly_newsletter(self, date_cache: Optional[_DateCache] = None) -> str:
         """Generate the weekly newsletter"""
         
         print("📰 Generating Weekly News Newsletter...")
@@ -377,10 +682,23 @@ else:
         if not self.companies:
             return "No companies configured for tracking."
         
-        # Gather news for all companies
+        # Dates shared by every search and the newsletter header/footer
+        date_cache = date_cache or _DateCache()
+        now = date_cache.now
+        
+        # Gather news for all companies in parallel (results keep company order)
+        workers = min(self.max_company_workers, len(self.companies))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            company_results = list(executor.map(
+                lambda company: self.gather_news_for_company(company, date_cache=date_cache),
+                self.companies
+            ))
+        
+        # Persist any new AI analyses for the next run
+        self.save_analysis_cache()
+        
         all_news = {}
-        for company in self.companies:
-            articles = self.gather_news_for_company(company)
+        for company, articles in zip(self.companies, company_results):
             if articles:
                 all_news[company.name] = {
                     'company': company,
@@ -388,115 +706,121 @@ else:
                 }
         
         # Generate newsletter content
-        newsletter_date = datetime.now().strftime('%B %d, %Y')
-        week_start = (datetime.now() - timedelta(days=7)).strftime('%B %d')
-        week_end = datetime.now().strftime('%B %d, %Y')
+        newsletter_date = now.strftime('%B %d, %Y')
+        week_start = (now - timedelta(days=7)).strftime('%B %d')
+        week_end = newsletter_date
+        next_update = (now + timedelta(days=7)).strftime('%B %d, %Y')
         
-        newsletter_content = f"""
+        parts: List[str] = []
+        parts.append(f"""
 📰 WEEKLY COMPANY NEWS DIGEST 📰
 =========================================
 📅 Week of {week_start} - {week_end}
 🤖 Generated on {newsletter_date}
 
-"""
+""")
         
         if not all_news:
-            newsletter_content += "📭 No significant news found for tracked companies this week.\n"
+            parts.append("📭 No significant news found for tracked companies this week.\n")
         else:
             # Add executive summary
-            newsletter_content += f"📊 EXECUTIVE SUMMARY:\n"
-            newsletter_content += f"{'='*25}\n"
-            newsletter_content += f"🏢 Companies with news: {len(all_news)}\n"
+            parts.append(f"📊 EXECUTIVE SUMMARY:\n")
+            parts.append(f"{'='*25}\n")
+            parts.append(f"🏢 Companies with news: {len(all_news)}\n")
             total_articles = sum(len(data['articles']) for data in all_news.values())
-            newsletter_content += f"📰 Total articles analyzed: {total_articles}\n\n"
+            parts.append(f"📰 Total articles analyzed: {total_articles}\n\n")
             
             # Add company sections
             for company_name, data in all_news.items():
                 company = data['company']
                 articles = data['articles']
                 
-                priority_emoji = "🔴" if company.priority == 1 else "🟡" if company.priority == 2 else "🟢"
+                priority_emoji = _PRIORITY_EMOJI.get(company.priority, "🟢")
                 ticker_info = f" ({company.ticker})" if company.ticker else ""
                 
-                newsletter_content += f"{priority_emoji} {company_name.upper()}{ticker_info}\n"
-                newsletter_content += f"{'='*len(company_name.upper())}\n"
+                parts.append(f"{priority_emoji} {company_name.upper()}{ticker_info}\n")
+                parts.append(f"{'='*len(company_name.upper())}\n")
                 
                 # Sentiment overview
-                sentiments = [a.sentiment for a in articles]
-                positive_count = sentiments.count('positive')
-                negative_count = sentiments.count('negative')
-                neutral_count = sentiments.count('neutral')
+                sentiment_counts = Counter(a.sentiment for a in articles)
+                positive_count = sentiment_counts['positive']
+                negative_count = sentiment_counts['negative']
+                neutral_count = sentiment_counts['neutral']
                 
-                newsletter_content += f"📊 Sentiment Overview: "
+                parts.append(f"📊 Sentiment Overview: ")
                 if positive_count > 0:
-                    newsletter_content += f"✅{positive_count} Positive "
+                    parts.append(f"✅{positive_count} Positive ")
                 if negative_count > 0:
-                    newsletter_content += f"❌{negative_count} Negative "
+                    parts.append(f"❌{negative_count} Negative ")
                 if neutral_count > 0:
-                    newsletter_content += f"➖{neutral_count} Neutral"
-                newsletter_content += f"\n\n"
+                    parts.append(f"➖{neutral_count} Neutral")
+                parts.append(f"\n\n")
                 
                 # Add articles
                 for i, article in enumerate(articles, 1):
-                    sentiment_emoji = "✅" if article.sentiment == "positive" else "❌" if article.sentiment == "negative" else "➖"
+                    sentiment_emoji = _SENTIMENT_EMOJI.get(article.sentiment, "➖")
                     
-                    newsletter_content += f"   {i}. {sentiment_emoji} {article.title}\n"
-                    newsletter_content += f"      📅 {article.published_date[:10]} | 📰 {article.source}\n"
-                    newsletter_content += f"      📝 {article.summary}\n"
-                    newsletter_content += f"      🔗 {article.url}\n"
-                    newsletter_content += f"      📊 Relevance: {article.relevance_score:.1%}\n\n"
+                    parts.append(f"   {i}. {sentiment_emoji} {article.title}\n"
+                                 f"      📅 {article.published_date[:10]} | 📰 {article.source}\n"
+                                 f"      📝 {article.summary}\n"
+                                 f"      🔗 {article.url}\n"
+                                 f"      📊 Relevance: {article.relevance_score:.1%}\n\n")
                 
-                newsletter_content += f"\n"
+                parts.append(f"\n")
         
-        newsletter_content += f"""
+        priority_counts = Counter(c.priority for c in self.companies)
+        parts.append(f"""
 🔧 NEWSLETTER SETTINGS:
 =======================
-📈 High Priority: {len([c for c in self.companies if c.priority == 1])} companies
-📊 Medium Priority: {len([c for c in self.companies if c.priority == 2])} companies  
-📉 Low Priority: {len([c for c in self.companies if c.priority == 3])} companies
+📈 High Priority: {priority_counts[1]} companies
+📊 Medium Priority: {priority_counts[2]} companies  
+📉 Low Priority: {priority_counts[3]} companies
 
 ⚙️ Configure companies: python news_agent.py --config
 🔍 Run manual search: python news_agent.py --search
 📰 Generate newsletter: python news_agent.py --newsletter
 
 ---
-🤖 Automated by News Agent | Next update: {(datetime.now() + timedelta(days=7)).strftime('%B %d, %Y')}
-"""
+🤖 Automated by News Agent | Next update: {next_update}
+""")
         
-        return newsletter_content
+        return "".join(parts)
     
-    def save_newsletter(self, content: str):
+    def save_newsletter(self, content: str, now: Optional[datetime] = None):
         """Save newsletter to file"""
         
-        date_str = datetime.now().strftime('%Y%m%d')
+        date_str = (now or datetime.now()).strftime('%Y%m%d')
         filename = f"weekly_newsletter_{date_str}.txt"
         filepath = os.path.join(self.newsletter_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_file_atomic(filepath, content.encode('utf-8'))
         
         print(f"📰 Newsletter saved: {filepath}")
         return filepath
     
     def run_weekly_newsletter(self):
-        """Main function to generate and save weekly newsletter"""
+        """Main function to generate and save weekly newsletter
+        
+        Returns (filepath, content), or (None, None) if no companies are configured
+        """
         
         print("🤖 Starting Weekly News Agent...")
         
         if not self.companies:
             print("⚠️ No companies configured. Add companies first.")
-            return
+            return None, None
         
-        # Generate newsletter
-        content = self.generate_weekly_newsletter()
+        # Generate and save with one shared timestamp
+        date_cache = _DateCache()
+        content = self.generate_weekly_newsletter(date_cache)
         
         # Save newsletter
-        filepath = self.save_newsletter(content)
+        filepath = self.save_newsletter(content, date_cache.now)
         
         print(f"✅ Weekly newsletter complete!")
         print(f"📄 Newsletter saved to: {filepath}")
         
-        return filepath
+        return filepath, content
 
 def main():
     """Main CLI interface for the news agent"""
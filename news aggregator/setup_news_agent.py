@@ -33,13 +33,7 @@ def setup_sample_companies():
     ]
     
     # Add companies
-    for company in sample_companies:
-        agent.add_company(
-            name=company["name"],
-            ticker=company["ticker"],
-            keywords=company["keywords"],
-            priority=company["priority"]
-        )
+    agent.add_companies(sample_companies)
     
     print(f"\n✅ Setup complete! Added {len(sample_companies)} companies")
     
@@ -66,29 +60,46 @@ def demo_newsletter_generation():
         agent = setup_sample_companies()
     
     # Generate newsletter
-    newsletter_path = agent.run_weekly_newsletter()
+    newsletter_path, _ = agent.run_weekly_newsletter()
     
     print(f"\n✅ Demo newsletter generated!")
     print(f"📄 Check the file: {newsletter_path}")
 
 if __name__ == "__main__":
     import argparse
+    import sys
+    
+    # Subcommand -> steps to run, in order
+    commands = {
+        "setup": (setup_sample_companies,),
+        "demo": (demo_newsletter_generation,),
+        "both": (setup_sample_companies, demo_newsletter_generation),
+    }
     
     parser = argparse.ArgumentParser(description="Setup News Agent")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('setup', help='Setup sample companies')
+    subparsers.add_parser('demo', help='Generate demo newsletter')
+    subparsers.add_parser('both', help='Setup and generate demo')
+    
+    # Flag forms kept for existing scripts and docs
     parser.add_argument('--setup', action='store_true', help='Setup sample companies')
     parser.add_argument('--demo', action='store_true', help='Generate demo newsletter')
     parser.add_argument('--both', action='store_true', help='Setup and generate demo')
     
     args = parser.parse_args()
     
-    if args.setup or args.both:
-        setup_sample_companies()
-    
-    if args.demo or args.both:
-        demo_newsletter_generation()
-    
-    if not any([args.setup, args.demo, args.both]):
-        # Default behavior
+    command = args.command
+    if command is None:
+        if args.both or (args.setup and args.demo):
+            command = "both"
+        elif args.setup:
+            command = "setup"
+        elif args.demo:
+            command = "demo"
+    
+    if command is None and sys.stdin.isatty():
+        # Interactive default
         print("🤖 News Agent Setup")
         print("Choose an option:")
         print("  1. Setup sample companies")
@@ -96,13 +107,13 @@ if __name__ == "__main__":
         print("  3. Both")
         
         choice = input("\nEnter choice (1-3): ").strip()
+        command = {"1": "setup", "2": "demo", "3": "both"}.get(choice)
         
-        if choice == "1":
-            setup_sample_companies()
-        elif choice == "2":
-            demo_newsletter_generation()
-        elif choice == "3":
-            setup_sample_companies()
-            demo_newsletter_generation()
-        else:
-            print("Invalid choice")
\ No newline at end of file
+        if command is None:
+            print("Invalid choice")
+    elif command is None:
+        # Non-interactive runs (cron, pipes) never block on a prompt
+        command = "setup"
+    
+    for step in commands.get(command, ()):
+        step()
@@ -5,14 +5,14 @@ Weekly News Scheduler
 Automated scheduler to run the news agent weekly and send newsletters
 """
 
-import schedule
 import time
 from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from news_agent import NewsAgent
-import os
+
+# schedule, smtplib and email.mime are imported where they are used, so
+# one-off runs (--test without --email) skip loading them
+
+DAYS_OF_WEEK = frozenset(["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"])
 
 class NewsScheduler:
     """Automated scheduler for weekly newsletters"""
@@ -20,30 +20,61 @@ class NewsScheduler:
     def __init__(self, openai_key: str = None, email_config: dict = None):
         self.agent = NewsAgent(openai_api_key=openai_key)
         self.email_config = email_config or {}
+        self._smtp = None
+    
+    def _get_smtp(self) -> "smtplib.SMTP":
+        """Return a logged-in SMTP connection, reusing the open one"""
+        
+        if self._smtp is not None:
+            return self._smtp
+        
+        import smtplib
+        
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
+        server.starttls()
+        server.login(self.email_config['smtp_user'], self.email_config['smtp_password'])
+        self._smtp = server
+        return server
+    
+    def close(self):
+        """Close the SMTP connection if one is open"""
         
-    def send_email_newsletter(self, newsletter_content: str, recipient_email: str):
+        if self._smtp is not None:
+            import smtplib
+            
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+    
+    def send_email_newsletter(self, newsletter_content: str, recipient_email: str, sent_at: datetime = None):
         """Send newsletter via email"""
         
         if not self.email_config:
             print("⚠️ No email configuration provided. Newsletter saved to file only.")
             return
         
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        
         try:
             # Create message
             msg = MIMEMultipart()
             msg['From'] = self.email_config['smtp_user']
             msg['To'] = recipient_email
-            msg['Subject'] = f"Weekly Company News Digest - {datetime.now().strftime('%B %d, %Y')}"
+            msg['Subject'] = f"Weekly Company News Digest - {(sent_at or datetime.now()).strftime('%B %d, %Y')}"
             
             # Add newsletter content
             msg.attach(MIMEText(newsletter_content, 'plain'))
             
-            # Send email
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            server.login(self.email_config['smtp_user'], self.email_config['smtp_password'])
-            server.send_message(msg)
-            server.quit()
+            # Send email (reconnect once if the server dropped the connection)
+            try:
+                self._get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._get_smtp().send_message(msg)
             
             print(f"📧 Newsletter emailed to {recipient_email}")
             
@@ -54,22 +85,21 @@ class NewsScheduler:
     def run_weekly_job(self):
         """Main weekly job to generate and send newsletter"""
         
-        print(f"🤖 Running weekly news job at {datetime.now()}")
+        # Wall-clock time for the log and email subject, monotonic clock for the duration
+        started_at = datetime.now()
+        started = time.monotonic()
+        print(f"🤖 Running weekly news job at {started_at}")
         
         try:
-            # Generate newsletter
-            newsletter_path = self.agent.run_weekly_newsletter()
+            # Generate newsletter (content comes back with the saved path)
+            newsletter_path, content = self.agent.run_weekly_newsletter()
             
-            # Read newsletter content
-            if os.path.exists(newsletter_path):
-                with open(newsletter_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
+            if newsletter_path:
                 # Send email if configured
                 if self.email_config and 'recipient_email' in self.email_config:
-                    self.send_email_newsletter(content, self.email_config['recipient_email'])
+                    self.send_email_newsletter(content, self.email_config['recipient_email'], started_at)
                 
-                print(f"✅ Weekly news job completed successfully")
+                print(f"✅ Weekly news job completed successfully in {time.monotonic() - started:.1f}s")
             
         except Exception as e:
             print(f"❌ Weekly news job failed: {e}")
@@ -77,36 +107,40 @@ class NewsScheduler:
     def setup_schedule(self, day_of_week: str = "monday", time_str: str = "09:00"):
         """Setup weekly schedule"""
         
+        import schedule
+        
         print(f"📅 Scheduling weekly newsletter for {day_of_week}s at {time_str}")
         
-        # Schedule the job
-        if day_of_week.lower() == "monday":
-            schedule.every().monday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "tuesday":
-            schedule.every().tuesday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "wednesday":
-            schedule.every().wednesday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "thursday":
-            schedule.every().thursday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "friday":
-            schedule.every().friday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "saturday":
-            schedule.every().saturday.at(time_str).do(self.run_weekly_job)
-        elif day_of_week.lower() == "sunday":
-            schedule.every().sunday.at(time_str).do(self.run_weekly_job)
+        # Schedule the job (each day is a property on schedule's Job that
+        # mutates it, so look up only the requested one)
+        day = day_of_week.lower()
+        if day not in DAYS_OF_WEEK:
+            raise ValueError(f"Invalid day of week: {day_of_week}")
+        
+        getattr(schedule.every(), day).at(time_str).do(self.run_weekly_job)
     
     def start_scheduler(self):
         """Start the scheduler loop"""
         
+        import schedule
+        
         print("🚀 News scheduler started. Press Ctrl+C to stop.")
         print("📅 Next run:", schedule.next_run())
         
         try:
             while True:
+                # Sleep until the next job is due (capped so Ctrl+C stays responsive)
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    print("📭 No jobs scheduled")
+                    break
+                if idle > 0:
+                    time.sleep(min(idle, 3600))
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
         except KeyboardInterrupt:
             print("\n⏹️ Scheduler stopped by user")
+        finally:
+            self.close()
 
 def main():
     """Main function for the scheduler"""
@@ -141,6 +175,7 @@ def main():
         # Test mode - run once
         print("🧪 Test mode: Running newsletter generation once...")
         scheduler.run_weekly_job()
+        scheduler.close()
     else:
         # Schedule mode
         scheduler.setup_schedule(args.day, args.time)
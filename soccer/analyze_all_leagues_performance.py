@@ -6,8 +6,11 @@ Analyze All Leagues Performance from Backtest Data
 Determine which of the top 30 major leagues globally would be profitable to include
 """
 
-import pandas as pd
 import numpy as np
+from analyze_backtest import load_cached_backtest
+
+# Row format shared by the top/worst/volume league tables
+_LEAGUE_FMT = "{league:25} | {total_bets:3d} bets | {win_rate:5.1f}% WR | {roi:+7.1f}% ROI | ${total_profit:+8.2f}".format_map
 
 def analyze_all_leagues_performance():
     """Analyze performance of all leagues in backtest data"""
@@ -17,7 +20,7 @@ def analyze_all_leagues_performance():
     
     # Read the comprehensive backtest data
     try:
-        df = pd.read_csv('output reports/backtest_detailed_20240801_20250904.csv')
+        df = load_cached_backtest()
         print(f"📊 Loaded {len(df):,} betting records")
     except Exception as e:
         print(f"❌ Error loading backtest data: {e}")
@@ -25,66 +28,50 @@ def analyze_all_leagues_performance():
     
     print()
     
-    # Analyze league performance
-    league_stats = df.groupby('league').agg({
-        'bet_won': ['count', 'sum'],  # Total bets, wins
-        'profit_loss': 'sum',         # Total P&L
-        'stake': 'sum',               # Total staked
-        'edge': 'mean',               # Average edge
-        'confidence': 'mean'          # Average confidence
-    }).round(3)
-    
-    # Calculate derived metrics
-    league_analysis = []
-    
-    for league in league_stats.index:
-        total_bets = league_stats.loc[league, ('bet_won', 'count')]
-        wins = league_stats.loc[league, ('bet_won', 'sum')]
-        profit = league_stats.loc[league, ('profit_loss', 'sum')]
-        stake = league_stats.loc[league, ('stake', 'sum')]
-        avg_edge = league_stats.loc[league, ('edge', 'mean')]
-        avg_confidence = league_stats.loc[league, ('confidence', 'mean')]
-        
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-        roi = (profit / stake * 100) if stake > 0 else 0
-        avg_profit_per_bet = profit / total_bets if total_bets > 0 else 0
-        
-        league_analysis.append({
-            'league': league,
-            'total_bets': int(total_bets),
-            'win_rate': win_rate,
-            'roi': roi,
-            'total_profit': profit,
-            'avg_profit_per_bet': avg_profit_per_bet,
-            'avg_edge': avg_edge,
-            'avg_confidence': avg_confidence
-        })
-    
-    # Convert to DataFrame for easy sorting
-    analysis_df = pd.DataFrame(league_analysis)
+    # Analyze league performance (flat columns, one row per league)
+    league_stats = df.groupby('league').agg(
+        total_bets=('bet_won', 'count'),
+        wins=('bet_won', 'sum'),
+        total_profit=('profit_loss', 'sum'),
+        stake=('stake', 'sum'),
+        avg_edge=('edge', 'mean'),
+        avg_confidence=('confidence', 'mean')
+    ).round(3).reset_index()
+    
+    # Calculate derived metrics for every league at once
+    bets = league_stats['total_bets']
+    stake = league_stats['stake']
+    league_stats['win_rate'] = (league_stats['wins'] / bets.where(bets > 0) * 100).fillna(0)
+    league_stats['roi'] = (league_stats['total_profit'] / stake.where(stake > 0) * 100).fillna(0)
+    league_stats['avg_profit_per_bet'] = (league_stats['total_profit'] / bets.where(bets > 0)).fillna(0)
+    
+    analysis_df = league_stats[[
+        'league', 'total_bets', 'win_rate', 'roi', 'total_profit',
+        'avg_profit_per_bet', 'avg_edge', 'avg_confidence'
+    ]]
     
     print("🏆 TOP PERFORMING LEAGUES (by ROI):")
     print("-" * 40)
-    top_performers = analysis_df.sort_values('roi', ascending=False).head(15)
+    top_performers = analysis_df.nlargest(15, 'roi')
     
-    for i, row in top_performers.iterrows():
-        print(f"{row['league']:25} | {row['total_bets']:3d} bets | {row['win_rate']:5.1f}% WR | {row['roi']:+7.1f}% ROI | ${row['total_profit']:+8.2f}")
+    for row in top_performers.itertuples(index=False):
+        print(_LEAGUE_FMT(row._asdict()))
     
     print()
     print("💸 WORST PERFORMING LEAGUES (by ROI):")
     print("-" * 40)
-    worst_performers = analysis_df.sort_values('roi', ascending=True).head(10)
+    worst_performers = analysis_df.nsmallest(10, 'roi')
     
-    for i, row in worst_performers.iterrows():
-        print(f"{row['league']:25} | {row['total_bets']:3d} bets | {row['win_rate']:5.1f}% WR | {row['roi']:+7.1f}% ROI | ${row['total_profit']:+8.2f}")
+    for row in worst_performers.itertuples(index=False):
+        print(_LEAGUE_FMT(row._asdict()))
     
     print()
     print("📊 VOLUME LEADERS (by total bets):")
     print("-" * 40)
-    volume_leaders = analysis_df.sort_values('total_bets', ascending=False).head(10)
+    volume_leaders = analysis_df.nlargest(10, 'total_bets')
     
-    for i, row in volume_leaders.iterrows():
-        print(f"{row['league']:25} | {row['total_bets']:3d} bets | {row['win_rate']:5.1f}% WR | {row['roi']:+7.1f}% ROI | ${row['total_profit']:+8.2f}")
+    for row in volume_leaders.itertuples(index=False):
+        print(_LEAGUE_FMT(row._asdict()))
     
     print()
     
@@ -97,10 +84,11 @@ def analyze_all_leagues_performance():
     # 2. Reasonable performance (ROI > -50% to exclude disasters)
     # 3. Global significance
     
-    qualified_leagues = analysis_df[
-        (analysis_df['total_bets'] >= 3) &  # Minimum volume
-        (analysis_df['roi'] > -50)          # Not disasters
-    ].sort_values('roi', ascending=False)
+    qualified_mask = (
+        (analysis_df['total_bets'].to_numpy() >= 3) &  # Minimum volume
+        (analysis_df['roi'].to_numpy() > -50)          # Not disasters
+    )
+    qualified_leagues = analysis_df[qualified_mask].sort_values('roi', ascending=False)
     
     print("✅ QUALIFIED LEAGUES FOR EXPANSION:")
     profitable_count = 0
@@ -149,7 +137,8 @@ def analyze_all_leagues_performance():
         print("🔴 MAINTAIN CURRENT FOCUS - insufficient profitable opportunities")
         print("🎯 Stick to current followed leagues until market conditions improve")
     
-    return qualified_leagues
+    # Unfiltered, so the top-30 check can see every league with data
+    return analysis_df
 
 def create_top30_leagues_list(analysis_df):
     """Create a curated list of top 30 major global leagues"""
@@ -198,13 +187,17 @@ def create_top30_leagues_list(analysis_df):
     print("🌍 TOP 30 MAJOR GLOBAL LEAGUES:")
     print("=" * 40)
     
+    # Index league rows by name once (first row wins, as before)
+    by_league = {}
+    for row in analysis_df.itertuples(index=False):
+        by_league.setdefault(row.league, row)
+    
     for i, league in enumerate(top30_major_leagues, 1):
         # Check if we have data for this league
-        league_data = analysis_df[analysis_df['league'] == league]
-        if len(league_data) > 0:
-            row = league_data.iloc[0]
-            status = f"{row['total_bets']:3d} bets, {row['roi']:+5.1f}% ROI"
-            recommendation = "✅" if row['roi'] > 0 else ("🟡" if row['roi'] > -10 else "🔴")
+        row = by_league.get(league)
+        if row is not None:
+            status = f"{row.total_bets:3d} bets, {row.roi:+5.1f}% ROI"
+            recommendation = "✅" if row.roi > 0 else ("🟡" if row.roi > -10 else "🔴")
         else:
             status = "No data available"
             recommendation = "❓"
@@ -214,6 +207,7 @@ def create_top30_leagues_list(analysis_df):
     return top30_major_leagues
 
 if __name__ == "__main__":
-    qualified_leagues = analyze_all_leagues_performance()
-    print("\n" + "="*60)
-    create_top30_leagues_list(qualified_leagues)
\ No newline at end of file
+    analysis_df = analyze_all_leagues_performance()
+    if analysis_df is not None:
+        print("\n" + "="*60)
+        create_top30_leagues_list(analysis_df)
\ No newline at end of file
@@ -1,150 +1,230 @@
 #!/usr/bin/env python3
 
+import os
+import sys
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+# Optional pyarrow import (Parquet backtest storage)
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+BACKTEST_CSV = 'output reports/backtest_detailed_20240801_20250904.csv'
+BACKTEST_PARQUET = 'output reports/backtest_detailed_20240801_20250904.parquet'
+
+# Columns read by the backtest analyses (everything else in the file is skipped)
+BACKTEST_COLUMNS = [
+    'date', 'league', 'market', 'bet_won', 'profit_loss', 'stake', 'edge',
+    'confidence', 'expected_value', 'bankroll_after', 'bankroll_before'
+]
+
+# Backtest dates are written as ISO strings by backtest_system.py
+DATE_FORMAT = '%Y-%m-%d'
+
+# Explicit dtypes for the CSV read; numeric columns stay float64 so sums and the
+# confidence > 0.8 split match the stored values exactly
+BACKTEST_DTYPES = {'bet_won': 'bool'}
+
+def migrate_csv_to_parquet(csv_path=BACKTEST_CSV, parquet_path=BACKTEST_PARQUET):
+    """One-shot conversion of the backtest CSV to Snappy-compressed Parquet"""
+    
+    df = pd.read_csv(csv_path, dtype=BACKTEST_DTYPES)
+    # Store dates as datetime64 so Parquet loads never re-parse strings
+    df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT)
+    df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', row_group_size=200_000)
+    print(f"💾 Migrated {len(df):,} rows to {parquet_path}")
+    return parquet_path
+
+def load_backtest_data(columns=None, csv_path=BACKTEST_CSV, parquet_path=BACKTEST_PARQUET):
+    """Load backtest rows, reading only the requested columns
+    
+    Uses the Parquet copy when it exists (no CSV tokenizing, column pruning on disk),
+    otherwise falls back to the CSV with usecols.
+    """
+    
+    if PYARROW_AVAILABLE and os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, columns=columns, engine='pyarrow')
+    
+    dtypes = {col: dtype for col, dtype in BACKTEST_DTYPES.items() if columns is None or col in columns}
+    return pd.read_csv(csv_path, usecols=columns, dtype=dtypes)
+
+@lru_cache(maxsize=1)
+def load_cached_backtest():
+    """Backtest data with every analysis column, parsed once per process
+    
+    Callers share the returned DataFrame, so they must not modify it in place.
+    """
+    return load_backtest_data(columns=BACKTEST_COLUMNS)
+
+def _add_rates(stats):
+    """Add win_rate (and roi when stake is present) to flat aggregated stats in one vectorized pass"""
+    
+    bets = stats['total_bets']
+    stats['win_rate'] = (stats['wins'] / bets.where(bets > 0) * 100).fillna(0)
+    if 'stake' in stats:
+        stake = stats['stake']
+        stats['roi'] = (stats['profit'] / stake.where(stake > 0) * 100).fillna(0)
+    return stats
+
 def analyze_comprehensive_backtest():
     """Analyze the comprehensive historical backtest data"""
     
+    # Report lines are collected and written to stdout in one call at the end
+    buf = []
+    emit = buf.append
+    
     # Read the comprehensive backtest data
-    df = pd.read_csv('output reports/backtest_detailed_20240801_20250904.csv')
+    df = load_cached_backtest()
+    
+    emit('🏆 COMPREHENSIVE HISTORICAL BACKTEST ANALYSIS 🏆')
+    emit('='*60)
+    emit(f'📅 Period: August 1, 2024 - September 4, 2025')
+    emit(f'📊 Total Picks: {len(df):,}')
+    emit('')
     
-    print('🏆 COMPREHENSIVE HISTORICAL BACKTEST ANALYSIS 🏆')
-    print('='*60)
-    print(f'📅 Period: August 1, 2024 - September 4, 2025')
-    print(f'📊 Total Picks: {len(df):,}')
-    print()
+    # Column arrays extracted once for the whole-frame summaries (NaN-skipping like pandas)
+    won = df['bet_won'].to_numpy(dtype=bool)
+    profit_loss = df['profit_loss'].to_numpy(dtype=np.float64)
+    stake = df['stake'].to_numpy(dtype=np.float64)
+    confidence = df['confidence'].to_numpy(dtype=np.float64)
     
     # Calculate win/loss stats
-    wins = df[df['bet_won'] == True]
-    losses = df[df['bet_won'] == False]
-    win_rate = len(wins) / len(df) * 100
+    win_count = int(won.sum())
+    loss_count = len(won) - win_count
+    win_rate = win_count / len(df) * 100
     
-    print('📈 PERFORMANCE SUMMARY:')
-    print('-'*30)
-    print(f'✅ Winning Bets: {len(wins):,}')
-    print(f'❌ Losing Bets: {len(losses):,}')
-    print(f'🎯 Win Rate: {win_rate:.1f}%')
-    print()
+    emit('📈 PERFORMANCE SUMMARY:')
+    emit('-'*30)
+    emit(f'✅ Winning Bets: {win_count:,}')
+    emit(f'❌ Losing Bets: {loss_count:,}')
+    emit(f'🎯 Win Rate: {win_rate:.1f}%')
+    emit('')
     
     # Financial performance
-    total_profit = df['profit_loss'].sum()
-    total_staked = df['stake'].sum()
+    total_profit = np.nansum(profit_loss)
+    total_staked = np.nansum(stake)
     roi = (total_profit / total_staked) * 100 if total_staked > 0 else 0
     final_bankroll = df['bankroll_after'].iloc[-1]
     starting_bankroll = df['bankroll_before'].iloc[0]
     
-    print('💰 FINANCIAL PERFORMANCE:')
-    print('-'*30)
-    print(f'💸 Total Staked: ${total_staked:,.2f}')
-    print(f'💰 Total Profit/Loss: ${total_profit:+.2f}')
-    print(f'📊 ROI: {roi:+.2f}%')
-    print(f'🏦 Starting Bankroll: ${starting_bankroll:,.2f}')
-    print(f'🏦 Final Bankroll: ${final_bankroll:,.2f}')
-    print()
+    emit('💰 FINANCIAL PERFORMANCE:')
+    emit('-'*30)
+    emit(f'💸 Total Staked: ${total_staked:,.2f}')
+    emit(f'💰 Total Profit/Loss: ${total_profit:+.2f}')
+    emit(f'📊 ROI: {roi:+.2f}%')
+    emit(f'🏦 Starting Bankroll: ${starting_bankroll:,.2f}')
+    emit(f'🏦 Final Bankroll: ${final_bankroll:,.2f}')
+    emit('')
     
     # Market breakdown
-    print('🎯 MARKET BREAKDOWN:')
-    print('-'*30)
-    market_stats = df.groupby('market').agg({
-        'bet_won': ['count', 'sum'],
-        'profit_loss': 'sum',
-        'stake': 'sum'
-    }).round(2)
-    
-    for market in market_stats.index:
-        total_bets = market_stats.loc[market, ('bet_won', 'count')]
-        wins = market_stats.loc[market, ('bet_won', 'sum')]
-        profit = market_stats.loc[market, ('profit_loss', 'sum')]
-        stake = market_stats.loc[market, ('stake', 'sum')]
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-        roi = (profit / stake * 100) if stake > 0 else 0
-        print(f'{market}: {total_bets} bets, {win_rate:.1f}% win rate, ${profit:+.2f} P&L ({roi:+.1f}% ROI)')
-    print()
+    emit('🎯 MARKET BREAKDOWN:')
+    emit('-'*30)
+    market_stats = _add_rates(df.groupby('market').agg(
+        total_bets=('bet_won', 'count'),
+        wins=('bet_won', 'sum'),
+        profit=('profit_loss', 'sum'),
+        stake=('stake', 'sum')
+    ).round(2))
+    
+    buf.extend(
+        f'{market}: {total_bets} bets, {market_wr:.1f}% win rate, ${profit:+.2f} P&L ({market_roi:+.1f}% ROI)'
+        for market, total_bets, _, profit, _, market_wr, market_roi in market_stats.itertuples(name=None)
+    )
+    emit('')
     
     # League breakdown (top 10)
-    print('🏟️ TOP LEAGUES BY VOLUME:')
-    print('-'*30)
-    league_stats = df.groupby('league').agg({
-        'bet_won': ['count', 'sum'],
-        'profit_loss': 'sum'
-    }).round(2).sort_values(('bet_won', 'count'), ascending=False)
-    
-    for i, league in enumerate(league_stats.head(10).index):
-        total_bets = league_stats.loc[league, ('bet_won', 'count')]
-        wins = league_stats.loc[league, ('bet_won', 'sum')]
-        profit = league_stats.loc[league, ('profit_loss', 'sum')]
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-        print(f'{i+1}. {league}: {total_bets} bets, {win_rate:.1f}% win rate, ${profit:+.2f}')
-    print()
+    emit('🏟️ TOP LEAGUES BY VOLUME:')
+    emit('-'*30)
+    league_stats = _add_rates(df.groupby('league').agg(
+        total_bets=('bet_won', 'count'),
+        wins=('bet_won', 'sum'),
+        profit=('profit_loss', 'sum')
+    ).round(2).nlargest(10, 'total_bets', keep='first'))
+    
+    buf.extend(
+        f'{i}. {league}: {total_bets} bets, {league_wr:.1f}% win rate, ${profit:+.2f}'
+        for i, (league, total_bets, _, profit, league_wr) in enumerate(league_stats.itertuples(name=None), 1)
+    )
+    emit('')
     
     # Monthly performance
-    print('📅 MONTHLY PERFORMANCE:')
-    print('-'*30)
-    df['month'] = pd.to_datetime(df['date']).dt.to_period('M')
-    monthly_stats = df.groupby('month').agg({
-        'bet_won': ['count', 'sum'],
-        'profit_loss': 'sum',
-        'stake': 'sum'
-    }).round(2)
-    
-    for month in monthly_stats.index:
-        total_bets = monthly_stats.loc[month, ('bet_won', 'count')]
-        wins = monthly_stats.loc[month, ('bet_won', 'sum')]
-        profit = monthly_stats.loc[month, ('profit_loss', 'sum')]
-        stake = monthly_stats.loc[month, ('stake', 'sum')]
-        win_rate = (wins / total_bets * 100) if total_bets > 0 else 0
-        roi = (profit / stake * 100) if stake > 0 else 0
-        print(f'{month}: {total_bets} bets, {win_rate:.1f}% win rate, ${profit:+.2f} ({roi:+.1f}% ROI)')
-    print()
+    emit('📅 MONTHLY PERFORMANCE:')
+    emit('-'*30)
+    # Numeric year*100+month key (no Period objects); dates are parsed once,
+    # with an explicit format, and not at all when loaded from Parquet
+    dates = df['date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format=DATE_FORMAT, cache=True)
+    ym = dates.dt.year.to_numpy() * 100 + dates.dt.month.to_numpy()
+    monthly_stats = _add_rates(df.groupby(ym).agg(
+        total_bets=('bet_won', 'size'),
+        wins=('bet_won', 'sum'),
+        profit=('profit_loss', 'sum'),
+        stake=('stake', 'sum')
+    ).round(2))
+    
+    buf.extend(
+        f'{month // 100}-{month % 100:02d}: {total_bets} bets, {month_wr:.1f}% win rate, ${profit:+.2f} ({month_roi:+.1f}% ROI)'
+        for month, total_bets, _, profit, _, month_wr, month_roi in monthly_stats.itertuples(name=None)
+    )
+    emit('')
     
     # Best and worst streaks
-    print('📊 STREAK ANALYSIS:')
-    print('-'*30)
-    df['win_streak'] = (df['bet_won'] != df['bet_won'].shift()).cumsum()
-    streak_stats = df.groupby(['win_streak', 'bet_won']).size().reset_index(name='length')
-    winning_streaks = streak_stats[streak_stats['bet_won'] == True]['length']
-    losing_streaks = streak_stats[streak_stats['bet_won'] == False]['length']
-    
-    if len(winning_streaks) > 0:
-        print(f'🔥 Longest Winning Streak: {winning_streaks.max()} bets')
-    if len(losing_streaks) > 0:
-        print(f'❄️ Longest Losing Streak: {losing_streaks.max()} bets')
-    print()
+    emit('📊 STREAK ANALYSIS:')
+    emit('-'*30)
+    # Run-length encode bet_won: run boundaries, then each run's length and value
+    boundaries = np.flatnonzero(np.r_[True, won[1:] != won[:-1], True])
+    run_lengths = np.diff(boundaries)
+    run_won = won[boundaries[:-1]]
+    
+    if run_won.any():
+        emit(f'🔥 Longest Winning Streak: {run_lengths[run_won].max()} bets')
+    if (~run_won).any():
+        emit(f'❄️ Longest Losing Streak: {run_lengths[~run_won].max()} bets')
+    emit('')
     
     # Edge and confidence analysis
-    print('🎯 QUALITY METRICS:')
-    print('-'*30)
-    avg_edge = df['edge'].mean()
-    avg_confidence = df['confidence'].mean()
-    avg_ev = df['expected_value'].mean()
+    emit('🎯 QUALITY METRICS:')
+    emit('-'*30)
+    quality = df[['edge', 'confidence', 'expected_value']].to_numpy(dtype=np.float64)
+    avg_edge, avg_confidence, avg_ev = np.nanmean(quality, axis=0)
     
-    print(f'📊 Average Edge: {avg_edge:.3f}')
-    print(f'🎯 Average Confidence: {avg_confidence:.3f}')
-    print(f'💰 Average Expected Value: ${avg_ev:.2f}')
-    print()
+    emit(f'📊 Average Edge: {avg_edge:.3f}')
+    emit(f'🎯 Average Confidence: {avg_confidence:.3f}')
+    emit(f'💰 Average Expected Value: ${avg_ev:.2f}')
+    emit('')
     
     # High vs low confidence performance
-    high_conf = df[df['confidence'] > 0.8]
-    low_conf = df[df['confidence'] <= 0.8]
-    
-    if len(high_conf) > 0:
-        high_conf_wr = (high_conf['bet_won'].sum() / len(high_conf)) * 100
-        high_conf_roi = (high_conf['profit_loss'].sum() / high_conf['stake'].sum()) * 100
-        print(f'🔥 High Confidence (>80%): {len(high_conf)} bets, {high_conf_wr:.1f}% win rate, {high_conf_roi:+.1f}% ROI')
-    
-    if len(low_conf) > 0:
-        low_conf_wr = (low_conf['bet_won'].sum() / len(low_conf)) * 100
-        low_conf_roi = (low_conf['profit_loss'].sum() / low_conf['stake'].sum()) * 100
-        print(f'🆗 Lower Confidence (≤80%): {len(low_conf)} bets, {low_conf_wr:.1f}% win rate, {low_conf_roi:+.1f}% ROI')
-    
-    print()
-    print('⚠️ IMPORTANT NOTES:')
-    print('• All results are based on real historical match outcomes')
-    print('• Data verified through API-Sports integration')
-    print('• Performance covers 13+ months of actual betting activity')
-    print('• Results represent actual system performance with real money stakes')
+    high_mask = confidence > 0.8
+    low_mask = confidence <= 0.8
+    high_count = int(high_mask.sum())
+    low_count = int(low_mask.sum())
+    
+    if high_count > 0:
+        high_conf_wr = (won[high_mask].sum() / high_count) * 100
+        high_conf_roi = (np.nansum(profit_loss[high_mask]) / np.nansum(stake[high_mask])) * 100
+        emit(f'🔥 High Confidence (>80%): {high_count} bets, {high_conf_wr:.1f}% win rate, {high_conf_roi:+.1f}% ROI')
+    
+    if low_count > 0:
+        low_conf_wr = (won[low_mask].sum() / low_count) * 100
+        low_conf_roi = (np.nansum(profit_loss[low_mask]) / np.nansum(stake[low_mask])) * 100
+        emit(f'🆗 Lower Confidence (≤80%): {low_count} bets, {low_conf_wr:.1f}% win rate, {low_conf_roi:+.1f}% ROI')
+    
+    emit('')
+    emit('⚠️ IMPORTANT NOTES:')
+    emit('• All results are based on real historical match outcomes')
+    emit('• Data verified through API-Sports integration')
+    emit('• Performance covers 13+ months of actual betting activity')
+    emit('• Results represent actual system performance with real money stakes')
+    
+    sys.stdout.write('\n'.join(buf) + '\n')
 
 if __name__ == "__main__":
+    if '--migrate' in sys.argv:
+        migrate_csv_to_parquet()
     analyze_comprehensive_backtest()
\ No newline at end of file
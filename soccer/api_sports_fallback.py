@@ -4,9 +4,31 @@ API-Sports Fallback Integration
 Provides fallback fixture data when FootyStats doesn't have what we need
 """
 
+import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+
+# Optional requests-cache import (on-disk response cache for fixture queries)
+try:
+    import requests_cache
+    from requests_cache import NEVER_EXPIRE
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Fixture lists for today/future dates can still change; past dates never do
+FIXTURE_CACHE_TTL = 24 * 60 * 60
+FIXTURE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'apisports')
+
+def _is_cacheable_response(response):
+    """Cache filter: API-Sports reports quota/rate-limit errors as HTTP 200 with `errors` set"""
+    try:
+        return not response.json().get('errors')
+    except ValueError:
+        return False
 
 class APISportsFallback:
     """Fallback API for fixtures when FootyStats is insufficient"""
@@ -16,6 +38,19 @@ class APISportsFallback:
         self.base_url = "https://v3.football.api-sports.io"
         self.headers = {'x-apisports-key': api_key}
         
+        # Shared keep-alive session (pool sized for the parallel league fetches)
+        self.max_workers = 8
+        if REQUESTS_CACHE_AVAILABLE:
+            self.session = requests_cache.CachedSession(
+                FIXTURE_CACHE_PATH, expire_after=FIXTURE_CACHE_TTL, allowable_methods=['GET'],
+                filter_fn=_is_cacheable_response
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        
         # League mappings from our internal IDs to API-Sports IDs
         self.league_mappings = {
             'WC Qualification Europe': 32,
@@ -34,11 +69,25 @@ class APISportsFallback:
             'Ligue 1': 61
         }
     
+    def _get_fixtures(self, params, date_str):
+        """GET /fixtures, caching past dates forever and other dates for FIXTURE_CACHE_TTL"""
+        url = f"{self.base_url}/fixtures"
+        if not REQUESTS_CACHE_AVAILABLE:
+            return self.session.get(url, params=params, timeout=10)
+        
+        is_past = date_str < datetime.now().strftime('%Y-%m-%d')
+        expire_after = NEVER_EXPIRE if is_past else FIXTURE_CACHE_TTL
+        return self.session.get(url, params=params, timeout=10, expire_after=expire_after)
+    
     def test_connection(self):
         """Test API connection"""
         try:
-            response = requests.get(f"{self.base_url}/status", 
-                                  headers=self.headers, timeout=10)
+            if REQUESTS_CACHE_AVAILABLE:
+                # Status must always be live
+                with self.session.cache_disabled():
+                    response = self.session.get(f"{self.base_url}/status", timeout=10)
+            else:
+                response = self.session.get(f"{self.base_url}/status", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 return data.get('response', {})
@@ -64,8 +113,7 @@ class APISportsFallback:
                     'season': season_year
                 }
                 
-                response = requests.get(f"{self.base_url}/fixtures", 
-                                      headers=self.headers, params=params, timeout=10)
+                response = self._get_fixtures(params, date_str)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -82,6 +130,32 @@ class APISportsFallback:
             print(f"⚠️ API-Sports error for {league_name}: {e}")
             return []
     
+    def get_fixtures_all_leagues(self, date_str):
+        """Get every fixture on a date in one request, grouped by API-Sports league ID
+        
+        Returns None when the request fails (non-200, exception or API errors).
+        """
+        try:
+            response = self._get_fixtures({'date': date_str}, date_str)
+            
+            if response.status_code != 200:
+                return None
+            
+            data = response.json()
+            if data.get('errors'):
+                print(f"⚠️ API-Sports batched fixtures error: {data['errors']}")
+                return None
+            
+            fixtures_by_league = {}
+            for fixture in data.get('response', []):
+                league_id = fixture.get('league', {}).get('id')
+                fixtures_by_league.setdefault(league_id, []).append(fixture)
+            return fixtures_by_league
+            
+        except Exception as e:
+            print(f"⚠️ API-Sports batched fixtures error: {e}")
+            return None
+    
     def convert_api_sports_fixtures(self, api_fixtures, league_name):
         """Convert API-Sports fixtures to our standard format"""
         converted_fixtures = []
@@ -138,9 +212,26 @@ class APISportsFallback:
             'UEFA Europa League'
         ]
         
+        # One request for every league on the date, split client-side
+        fixtures_by_league = self.get_fixtures_all_leagues(date_str)
+        
+        results = {}
+        if fixtures_by_league is not None:
+            # A successful batched response is authoritative: absent leagues have no fixtures that day
+            for league in priority_leagues:
+                api_fixtures = fixtures_by_league.get(self.league_mappings[league], [])
+                if api_fixtures:
+                    print(f"✅ API-Sports: Found {len(api_fixtures)} {league} fixtures for {date_str}")
+                results[league] = self.convert_api_sports_fixtures(api_fixtures, league)
+        else:
+            # Batched call failed: per-league queries instead (in parallel, IO-bound)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = executor.map(lambda league: self.get_fixtures_for_league(league, date_str), priority_leagues)
+                results.update(zip(priority_leagues, fetched))
+        
+        # Keep priority league order
         for league in priority_leagues:
-            fixtures = self.get_fixtures_for_league(league, date_str)
-            all_fixtures.extend(fixtures)
+            all_fixtures.extend(results[league])
         
         print(f"🌍 API-Sports: Total {len(all_fixtures)} fixtures retrieved")
         return all_fixtures
@@ -4,22 +4,101 @@ Backdated Picks Generator
 Generates picks report for a specific past date (August 1, 2025)
 """
 
-from multi_market_predictor import MultiMarketPredictor
-from daily_comprehensive_games_reporter import DailyComprehensiveGamesReporter
 import pandas as pd
-from datetime import datetime, timedelta
-import random
-import csv
+import os
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
 import numpy as np
 
+# Optional numexpr import (fused evaluation of the quality-score expression)
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Default output directory (override with SOCCER_REPORT_DIR)
+REPORTS_DIR = "/Users/richardgibbons/soccer betting python/soccer/output reports"
+
+# Match fields copied onto each of its opportunities
+MATCH_CONTEXT_KEYS = ('kick_off', 'home_team', 'away_team', 'league')
+
+# Quality score over opportunity columns, evaluated in one pass by numexpr when present
+QUALITY_SCORE_EXPR = '0.4 * edge + 0.3 * (confidence - 0.5) + 0.3 * expected_value'
+QUALITY_SCORE_ENGINE = 'numexpr' if NUMEXPR_AVAILABLE else 'python'
+
+# Human-readable bet descriptions by market
+BET_DESCRIPTIONS = {
+    'Home': 'Home Team Win',
+    'Draw': 'Match Draw',
+    'Away': 'Away Team Win',
+    'Over 1.5': 'Over 1.5 Goals',
+    'Under 1.5': 'Under 1.5 Goals',
+    'Over 2.5': 'Over 2.5 Goals',
+    'Under 2.5': 'Under 2.5 Goals',
+    'Over 3.5': 'Over 3.5 Goals',
+    'Under 3.5': 'Under 3.5 Goals',
+    'BTTS Yes': 'Both Teams to Score - Yes',
+    'BTTS No': 'Both Teams to Score - No',
+    'Over 9.5 Corners': 'Over 9.5 Total Corners',
+    'Under 9.5 Corners': 'Under 9.5 Total Corners',
+    'Over 11.5 Corners': 'Over 11.5 Total Corners',
+    'Under 11.5 Corners': 'Under 11.5 Total Corners',
+    'Home/Draw': 'Home Win or Draw',
+    'Home/Away': 'Home Win or Away Win (No Draw)',
+    'Draw/Away': 'Draw or Away Win',
+    'Home Over 1.5': 'Home Team Over 1.5 Goals',
+    'Home Under 1.5': 'Home Team Under 1.5 Goals',
+    'Away Over 1.5': 'Away Team Over 1.5 Goals',
+    'Away Under 1.5': 'Away Team Under 1.5 Goals',
+    'Home +1': 'Home Team +1 Handicap',
+    'Away +1': 'Away Team +1 Handicap'
+}
+
+# Risk level by odds: <= 1.8 low, <= 3.0 medium, above that high
+RISK_ODDS_BINS = (1.8, 3.0)
+RISK_LEVELS = ('Low Risk', 'Medium Risk', 'High Risk')
+
+# Backdated picks CSV layout
+PICKS_CSV_COLUMNS = [
+    'date', 'kick_off', 'home_team', 'away_team', 'league', 'market',
+    'bet_description', 'odds', 'recommended_stake_pct', 'edge_percent',
+    'confidence_percent', 'expected_value', 'quality_score', 'risk_level'
+]
+
+def _classify_market(market):
+    """Classify market category"""
+    if market in ['Home', 'Draw', 'Away']:
+        return 'Match Result'
+    elif 'Over' in market or 'Under' in market:
+        if 'Corner' in market:
+            return 'Corners'
+        else:
+            return 'Goals'
+    elif 'BTTS' in market:
+        return 'Both Teams to Score'
+    elif '/' in market:
+        return 'Double Chance'
+    else:
+        return 'Special'
+
+# Categories for every described market, classified once at import
+MARKET_CATEGORIES = {market: _classify_market(market) for market in BET_DESCRIPTIONS}
+
 class BackdatedPicksGenerator:
     """Generate betting picks for a past date"""
     
     def __init__(self, api_key: str, target_date: str):
+        # Deferred so the model stack (sklearn) only loads when a generator is built
+        from multi_market_predictor import MultiMarketPredictor
+        
         self.api_key = api_key
         self.predictor = MultiMarketPredictor(api_key)
         self.target_date = target_date
-        self.day_name = datetime.strptime(target_date, '%Y-%m-%d').strftime('%A')
+        self.day_name = datetime.fromisoformat(target_date).strftime('%A')
+        self.date_str = target_date.replace('-', '')
+        self.reports_dir = Path(os.environ.get('SOCCER_REPORT_DIR', REPORTS_DIR))
         
         # August 1 would have had different leagues active
         self.august_active_leagues = [
@@ -117,62 +196,56 @@ class BackdatedPicksGenerator:
         
         print(f"🔍 Analyzing {len(matches)} matches from {self.target_date}...")
         
-        all_opportunities = []
-        
+        # Comprehensive odds for every match, with the main market odds we have on top
+        odds_list = []
         for match in matches:
-            # Generate comprehensive odds for this match
             odds = self.predictor.generate_realistic_odds()
-            
-            # Override with the main market odds we have
-            odds.update({
-                'home_ml': match['home_odds'],
-                'draw_ml': match['draw_odds'],
-                'away_ml': match['away_odds']
-            })
-            
-            # Analyze all markets
-            opportunities = self.predictor.analyze_all_markets(odds)
-            
-            # Add match context to each opportunity
-            for opp in opportunities:
-                opp.update({
-                    'kick_off': match['kick_off'],
-                    'home_team': match['home_team'],
-                    'away_team': match['away_team'],
-                    'league': match['league']
-                })
-                all_opportunities.append(opp)
-        
-        # Sort by expected value
-        all_opportunities.sort(key=lambda x: x['expected_value'], reverse=True)
+            odds['home_ml'] = match['home_odds']
+            odds['draw_ml'] = match['draw_odds']
+            odds['away_ml'] = match['away_odds']
+            odds_list.append(odds)
+        
+        # Analyze all markets for all matches in one batched model pass
+        opportunities_per_match = self.predictor.analyze_all_markets_batch(odds_list)
+        
+        # One record per opportunity with its match context
+        records = []
+        for match, opportunities in zip(matches, opportunities_per_match):
+            context = {field: match[field] for field in MATCH_CONTEXT_KEYS}
+            records.extend({**opp, **context} for opp in opportunities)
+        
+        # Opportunities carried as a DataFrame from here on, sorted by expected value (stable)
+        all_opportunities = pd.DataFrame.from_records(records)
+        if not all_opportunities.empty:
+            all_opportunities = all_opportunities.sort_values(
+                'expected_value', ascending=False, kind='stable', ignore_index=True
+            )
         
         return all_opportunities
     
     def filter_august_opportunities(self, opportunities, max_bets=10):
         """Filter for August's best betting opportunities"""
         
-        quality_bets = []
-        
-        for opp in opportunities:
-            # Quality criteria (slightly relaxed for August)
-            if (opp['edge'] > 0.06 and           # 6%+ edge
-                opp['confidence'] > 0.60 and     # 60%+ confidence  
-                opp['odds'] <= 7.0 and          # Reasonable odds
-                opp['kelly_fraction'] > 0.015):  # Meaningful stake
-                
-                # Add quality score
-                quality_score = (
-                    opp['edge'] * 0.4 +
-                    (opp['confidence'] - 0.5) * 0.3 +
-                    opp['expected_value'] * 0.3
-                )
-                opp['quality_score'] = quality_score
-                quality_bets.append(opp)
-        
-        # Sort by quality score
-        quality_bets.sort(key=lambda x: x['quality_score'], reverse=True)
+        # Quality criteria (slightly relaxed for August)
+        mask = (
+            (opportunities['edge'] > 0.06) &               # 6%+ edge
+            (opportunities['confidence'] > 0.60) &         # 60%+ confidence
+            (opportunities['odds'] <= 7.0) &               # Reasonable odds
+            (opportunities['kelly_fraction'] > 0.015)      # Meaningful stake
+        )
         
-        return quality_bets[:max_bets]
+        # Quality score, top max_bets by score (ties keep EV order), then the
+        # description and risk level both report writers read
+        return (
+            opportunities.loc[mask]
+            .assign(quality_score=lambda x: x.eval(QUALITY_SCORE_EXPR, engine=QUALITY_SCORE_ENGINE))
+            .nlargest(max_bets, 'quality_score')
+            .assign(
+                bet_description=lambda x: x['market'].map(BET_DESCRIPTIONS).fillna(x['market']),
+                risk_level=lambda x: pd.cut(x['odds'], bins=[-np.inf, *RISK_ODDS_BINS, np.inf], labels=list(RISK_LEVELS))
+            )
+            .reset_index(drop=True)
+        )
     
     def generate_backdated_report(self):
         """Generate complete backdated report for August 1"""
@@ -194,7 +267,7 @@ class BackdatedPicksGenerator:
         # Analyze all matches
         opportunities = self.analyze_august_matches(august_matches)
         
-        if not opportunities:
+        if opportunities.empty:
             print(f"❌ No betting opportunities found for {self.target_date}")
             return None
         
@@ -222,43 +295,27 @@ class BackdatedPicksGenerator:
     def save_backdated_report(self, report):
         """Save backdated report to files"""
         
-        date_str = self.target_date.replace('-', '')
+        date_str = self.date_str
         
         # Save detailed CSV
-        csv_filename = f"/Users/richardgibbons/soccer betting python/soccer/output reports/backdated_picks_{date_str}.csv"
-        
-        with open(csv_filename, 'w', newline='') as csvfile:
-            fieldnames = [
-                'date', 'kick_off', 'home_team', 'away_team', 'league',
-                'market', 'bet_description', 'odds', 'recommended_stake_pct',
-                'edge_percent', 'confidence_percent', 'expected_value',
-                'quality_score', 'risk_level'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for bet in report['best_bets']:
-                bet_description = self.get_bet_description(bet['market'])
-                risk_level = self.get_risk_level(bet['odds'])
-                
-                row = {
-                    'date': report['date'],
-                    'kick_off': bet['kick_off'],
-                    'home_team': bet['home_team'],
-                    'away_team': bet['away_team'],
-                    'league': bet['league'],
-                    'market': bet['market'],
-                    'bet_description': bet_description,
-                    'odds': bet['odds'],
-                    'recommended_stake_pct': round(bet['kelly_fraction'] * 100, 1),
-                    'edge_percent': round(bet['edge'] * 100, 1),
-                    'confidence_percent': round(bet['confidence'] * 100, 1),
-                    'expected_value': round(bet['expected_value'], 3),
-                    'quality_score': round(bet['quality_score'], 3),
-                    'risk_level': risk_level
-                }
-                writer.writerow(row)
+        csv_filename = self.reports_dir / f"backdated_picks_{date_str}.csv"
+        
+        bets = report['best_bets']
+        
+        # CSV columns straight from the best-bets frame (percentages as column ops)
+        picks_df = bets.assign(
+            date=report['date'],
+            recommended_stake_pct=bets['kelly_fraction'] * 100,
+            edge_percent=bets['edge'] * 100,
+            confidence_percent=bets['confidence'] * 100
+        )[PICKS_CSV_COLUMNS].round({
+            'recommended_stake_pct': 1, 'edge_percent': 1, 'confidence_percent': 1,
+            'expected_value': 3, 'quality_score': 3
+        })
+        
+        # 1 MiB write buffer so the rows reach disk in a few large writes
+        with open(csv_filename, 'w', newline='', buffering=1 << 20) as csvfile:
+            picks_df.to_csv(csvfile, index=False)
         
         print(f"💾 Backdated picks saved: backdated_picks_{date_str}.csv")
         
@@ -268,117 +325,79 @@ class BackdatedPicksGenerator:
     def generate_formatted_backdated_report(self, report, date_str):
         """Generate human-readable backdated report"""
         
-        report_filename = f"/Users/richardgibbons/soccer betting python/soccer/output reports/backdated_report_{date_str}.txt"
+        report_filename = self.reports_dir / f"backdated_report_{date_str}.txt"
         
-        with open(report_filename, 'w') as f:
-            f.write("⚽ BACKDATED SOCCER BETTING REPORT ⚽\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"📅 {report['day_name']}, {report['date']} (BACKDATED)\n")
-            f.write(f"🏟️ {report['total_matches']} matches analyzed\n")
-            f.write(f"🎯 {report['recommended_bets']} high-value bets recommended\n\n")
+        # Assemble the whole report, then write it once
+        parts = []
+        parts.append("⚽ BACKDATED SOCCER BETTING REPORT ⚽\n")
+        parts.append("=" * 50 + "\n")
+        parts.append(f"📅 {report['day_name']}, {report['date']} (BACKDATED)\n")
+        parts.append(f"🏟️ {report['total_matches']} matches analyzed\n")
+        parts.append(f"🎯 {report['recommended_bets']} high-value bets recommended\n\n")
+        
+        bets = report['best_bets']
+        
+        if not bets.empty:
+            parts.append("🌟 AUGUST 1 BEST BETS (BACKDATED):\n")
+            parts.append("=" * 35 + "\n\n")
+            
+            for i, bet in enumerate(bets.itertuples(index=False), 1):
+                parts.append(
+                    f"#{i} - {bet.kick_off} | {bet.league}\n"
+                    f"   {bet.home_team} vs {bet.away_team}\n"
+                    f"   🎯 BET: {bet.bet_description}\n"
+                    f"   📊 ODDS: {bet.odds:.2f}\n"
+                    f"   💰 STAKE: {bet.kelly_fraction*100:.1f}% of bankroll\n"
+                    f"   📈 EDGE: {bet.edge*100:.1f}%\n"
+                    f"   🎪 CONFIDENCE: {bet.confidence*100:.1f}%\n"
+                    f"   ⭐ QUALITY: {bet.quality_score:.3f}\n\n"
+                )
             
-            if report['best_bets']:
-                f.write("🌟 AUGUST 1 BEST BETS (BACKDATED):\n")
-                f.write("=" * 35 + "\n\n")
-                
-                for i, bet in enumerate(report['best_bets'], 1):
-                    bet_desc = self.get_bet_description(bet['market'])
-                    
-                    f.write(f"#{i} - {bet['kick_off']} | {bet['league']}\n")
-                    f.write(f"   {bet['home_team']} vs {bet['away_team']}\n")
-                    f.write(f"   🎯 BET: {bet_desc}\n")
-                    f.write(f"   📊 ODDS: {bet['odds']:.2f}\n")
-                    f.write(f"   💰 STAKE: {bet['kelly_fraction']*100:.1f}% of bankroll\n")
-                    f.write(f"   📈 EDGE: {bet['edge']*100:.1f}%\n")
-                    f.write(f"   🎪 CONFIDENCE: {bet['confidence']*100:.1f}%\n")
-                    f.write(f"   ⭐ QUALITY: {bet['quality_score']:.3f}\n\n")
-                
-                f.write("📊 AUGUST 1 BETTING SUMMARY:\n")
-                f.write("-" * 28 + "\n")
-                
-                total_edge = sum(bet['edge'] for bet in report['best_bets'])
-                avg_confidence = np.mean([bet['confidence'] for bet in report['best_bets']])
-                total_stake = sum(bet['kelly_fraction'] for bet in report['best_bets'])
-                
-                f.write(f"Total Portfolio Edge: {total_edge*100:.1f}%\n")
-                f.write(f"Average Confidence: {avg_confidence*100:.1f}%\n")
-                f.write(f"Total Bankroll Risk: {total_stake*100:.1f}%\n")
-                
-                # Market breakdown
-                f.write(f"\n📈 AUGUST MARKETS COVERED:\n")
-                markets = {}
-                for bet in report['best_bets']:
-                    market_cat = self.classify_market_category(bet['market'])
-                    markets[market_cat] = markets.get(market_cat, 0) + 1
-                
-                for market, count in markets.items():
-                    f.write(f"   {market}: {count} bet{'s' if count > 1 else ''}\n")
+            parts.append("📊 AUGUST 1 BETTING SUMMARY:\n")
+            parts.append("-" * 28 + "\n")
             
-            else:
-                f.write("❌ No high-quality betting opportunities found for August 1.\n")
+            # Summary reduced straight from the frame's columns
+            total_edge = bets['edge'].sum()
+            avg_confidence = bets['confidence'].mean()
+            total_stake = bets['kelly_fraction'].sum()
             
-            f.write(f"\n⚠️ BACKDATED REPORT NOTES:\n")
-            f.write("• This is a simulated report for August 1, 2025\n")
-            f.write("• Actual historical results not available\n")
-            f.write("• Generated using current prediction models\n")
-            f.write("• For analysis and system testing purposes\n")
+            parts.append(f"Total Portfolio Edge: {total_edge*100:.1f}%\n")
+            parts.append(f"Average Confidence: {avg_confidence*100:.1f}%\n")
+            parts.append(f"Total Bankroll Risk: {total_stake*100:.1f}%\n")
+            
+            # Market breakdown
+            parts.append(f"\n📈 AUGUST MARKETS COVERED:\n")
+            market_counts = Counter(map(self.classify_market_category, bets['market']))
+            
+            for market, count in market_counts.items():
+                parts.append(f"   {market}: {count} bet{'s' if count > 1 else ''}\n")
+        
+        else:
+            parts.append("❌ No high-quality betting opportunities found for August 1.\n")
+        
+        parts.append(f"\n⚠️ BACKDATED REPORT NOTES:\n")
+        parts.append("• This is a simulated report for August 1, 2025\n")
+        parts.append("• Actual historical results not available\n")
+        parts.append("• Generated using current prediction models\n")
+        parts.append("• For analysis and system testing purposes\n")
+        
+        with open(report_filename, 'w') as f:
+            f.write(''.join(parts))
         
         print(f"📋 Backdated report saved: backdated_report_{date_str}.txt")
     
     def get_bet_description(self, market):
         """Get human-readable bet description"""
-        descriptions = {
-            'Home': 'Home Team Win',
-            'Draw': 'Match Draw', 
-            'Away': 'Away Team Win',
-            'Over 1.5': 'Over 1.5 Goals',
-            'Under 1.5': 'Under 1.5 Goals',
-            'Over 2.5': 'Over 2.5 Goals',
-            'Under 2.5': 'Under 2.5 Goals',
-            'Over 3.5': 'Over 3.5 Goals',
-            'Under 3.5': 'Under 3.5 Goals',
-            'BTTS Yes': 'Both Teams to Score - Yes',
-            'BTTS No': 'Both Teams to Score - No',
-            'Over 9.5 Corners': 'Over 9.5 Total Corners',
-            'Under 9.5 Corners': 'Under 9.5 Total Corners',
-            'Over 11.5 Corners': 'Over 11.5 Total Corners',
-            'Under 11.5 Corners': 'Under 11.5 Total Corners',
-            'Home/Draw': 'Home Win or Draw',
-            'Home/Away': 'Home Win or Away Win (No Draw)',
-            'Draw/Away': 'Draw or Away Win',
-            'Home Over 1.5': 'Home Team Over 1.5 Goals',
-            'Home Under 1.5': 'Home Team Under 1.5 Goals',
-            'Away Over 1.5': 'Away Team Over 1.5 Goals',
-            'Away Under 1.5': 'Away Team Under 1.5 Goals',
-            'Home +1': 'Home Team +1 Handicap',
-            'Away +1': 'Away Team +1 Handicap'
-        }
-        return descriptions.get(market, market)
+        return BET_DESCRIPTIONS.get(market, market)
     
     def get_risk_level(self, odds):
         """Classify risk level"""
-        if odds <= 1.8:
-            return 'Low Risk'
-        elif odds <= 3.0:
-            return 'Medium Risk'
-        else:
-            return 'High Risk'
+        return RISK_LEVELS[int(np.digitize(odds, RISK_ODDS_BINS, right=True))]
     
     def classify_market_category(self, market):
         """Classify market category"""
-        if market in ['Home', 'Draw', 'Away']:
-            return 'Match Result'
-        elif 'Over' in market or 'Under' in market:
-            if 'Corner' in market:
-                return 'Corners'
-            else:
-                return 'Goals'
-        elif 'BTTS' in market:
-            return 'Both Teams to Score'
-        elif '/' in market:
-            return 'Double Chance'
-        else:
-            return 'Special'
+        category = MARKET_CATEGORIES.get(market)
+        return category if category is not None else _classify_market(market)
 
 
 def main():
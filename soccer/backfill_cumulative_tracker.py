@@ -6,8 +6,12 @@ Adds historical picks from September 7, 2025 onwards to the cumulative tracker
 """
 
 from cumulative_picks_tracker import CumulativePicksTracker
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
+import re
+
+# Daily picks report filename, capturing its YYYYMMDD date
+DAILY_PICKS_PATTERN = re.compile(r'daily_picks_(\d{8})\.csv$')
 
 def backfill_historical_picks():
     """Backfill cumulative tracker with historical picks since September 7"""
@@ -22,22 +26,31 @@ def backfill_historical_picks():
     print("📈 Backfilling cumulative tracker with historical picks...")
     print(f"📅 Date range: {start_date.strftime('%Y-%m-%d')} to {current_date.strftime('%Y-%m-%d')}")
     
-    date = start_date
+    # Scan the reports directory once and keep only picks files dated inside the range
+    reports_dir = "/Users/richardgibbons/Documents/AI Ideas/soccer betting python/soccer/output reports"
+    first_str = start_date.strftime('%Y%m%d')
+    last_str = current_date.strftime('%Y%m%d')
+    
+    try:
+        with os.scandir(reports_dir) as entries:
+            matches = (DAILY_PICKS_PATTERN.match(entry.name) for entry in entries)
+            available_dates = sorted(
+                match.group(1) for match in matches
+                if match and first_str <= match.group(1) <= last_str
+            )
+    except FileNotFoundError:
+        available_dates = []
+    
     total_added = 0
     
-    while date <= current_date:
-        date_str = date.strftime('%Y%m%d')
-        picks_file = f"/Users/richardgibbons/Documents/AI Ideas/soccer betting python/soccer/output reports/daily_picks_{date_str}.csv"
-        
-        if os.path.exists(picks_file):
-            print(f"📊 Processing {date.strftime('%Y-%m-%d')}...")
-            try:
-                tracker.add_daily_picks_to_tracker(date_str)
-                total_added += 1
-            except Exception as e:
-                print(f"⚠️ Error processing {date_str}: {e}")
-        
-        date += timedelta(days=1)
+    # Only days that have a picks file are visited (YYYYMMDD sorts chronologically)
+    for date_str in available_dates:
+        print(f"📊 Processing {date_str[:4]}-{date_str[4:6]}-{date_str[6:]}...")
+        try:
+            tracker.add_daily_picks_to_tracker(date_str)
+            total_added += 1
+        except Exception as e:
+            print(f"⚠️ Error processing {date_str}: {e}")
     
     print(f"\n✅ Backfill complete! Processed {total_added} days of historical picks")
     
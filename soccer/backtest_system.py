@@ -9,19 +9,145 @@ Tests the betting system from August 1st onwards, showing:
 - Daily and cumulative bankroll progression
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import json
 from csv_predictions_generator import CSVPredictionsGenerator
 from daily_bankroll_manager import DailyBankrollManager
-import random
+
+# Optional numba import (JIT for the per-day bet selection loop)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional pyarrow import (Parquet copy of the detailed results)
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Default directory for the backtest result files
+RESULTS_DIR = "/Users/richardgibbons/soccer betting python"
+
+# Simulated leagues and their fixtures (Ligue 1 has no fixtures, so its draws are skipped)
+BACKTEST_LEAGUES = ('Premier League', 'La Liga', 'Bundesliga', 'Serie A', 'Ligue 1', 'MLS', 'Liga MX')
+BACKTEST_FIXTURES = {
+    'Premier League': [
+        ('Manchester City', 'Arsenal'), ('Liverpool', 'Chelsea'), ('Tottenham', 'Manchester United'),
+        ('Newcastle', 'Brighton'), ('Aston Villa', 'West Ham'), ('Crystal Palace', 'Fulham')
+    ],
+    'La Liga': [
+        ('Real Madrid', 'Barcelona'), ('Atletico Madrid', 'Valencia'), ('Sevilla', 'Real Betis'),
+        ('Villarreal', 'Athletic Bilbao'), ('Real Sociedad', 'Getafe'), ('Osasuna', 'Celta Vigo')
+    ],
+    'Bundesliga': [
+        ('Bayern Munich', 'Borussia Dortmund'), ('RB Leipzig', 'Bayer Leverkusen'), 
+        ('Eintracht Frankfurt', 'VfB Stuttgart'), ('Borussia Monchengladbach', 'Wolfsburg')
+    ],
+    'Serie A': [
+        ('Juventus', 'AC Milan'), ('Inter Milan', 'Napoli'), ('AS Roma', 'Lazio'),
+        ('Atalanta', 'Fiorentina'), ('Bologna', 'Torino')
+    ],
+    'MLS': [
+        ('LA Galaxy', 'LAFC'), ('Inter Miami', 'New York City FC'), ('Seattle Sounders', 'Portland Timbers')
+    ],
+    'Liga MX': [
+        ('Club America', 'Chivas'), ('Cruz Azul', 'Pumas'), ('Monterrey', 'Tigres')
+    ]
+}
+
+# Integer-keyed fixture table: all pairs flattened, with each league's offset and pair count
+_FIXTURE_PAIRS = [pair for league in BACKTEST_LEAGUES for pair in BACKTEST_FIXTURES.get(league, [])]
+FIXTURE_HOME = np.array([home for home, _ in _FIXTURE_PAIRS], dtype=object)
+FIXTURE_AWAY = np.array([away for _, away in _FIXTURE_PAIRS], dtype=object)
+FIXTURE_COUNTS = np.array([len(BACKTEST_FIXTURES.get(league, [])) for league in BACKTEST_LEAGUES])
+FIXTURE_OFFSETS = np.concatenate(([0], np.cumsum(FIXTURE_COUNTS)[:-1]))
+
+# Match outcomes by index: 0 home, 1 draw, 2 away
+OUTCOMES = np.array(['Home Win', 'Draw', 'Away Win'])
+
+# Scoreline pools sampled for winners, losers and draws
+WINNER_GOALS = np.array([1, 2, 2, 3, 3, 4])
+LOSER_GOALS = np.array([0, 0, 1, 1, 2])
+DRAW_GOALS = np.array([0, 1, 1, 2, 2])
+
+# Winning condition per market: (actual-result column, value it must equal)
+WIN_CONDITIONS = {
+    # 1X2 Markets
+    'Home Win': ('actual_result', 'Home Win'),
+    'Away Win': ('actual_result', 'Away Win'),
+    'Draw': ('actual_result', 'Draw'),
+    
+    # BTTS Markets
+    'BTTS Yes': ('btts_actual', 'YES'),
+    'BTTS No': ('btts_actual', 'NO'),
+    
+    # Goals Markets
+    'Over 2.5 Goals': ('over_25_actual', 'OVER'),
+    'Under 2.5 Goals': ('over_25_actual', 'UNDER')
+}
+
+# Actual-result fields joined onto each selected bet
+OUTCOME_COLUMNS = ['actual_result', 'home_score', 'away_score', 'btts_actual', 'over_25_actual']
+
+# Bet-by-bet result record (one structured array per backtest run, same field names as the CSV)
+BET_DTYPE = np.dtype([
+    ('date', 'U10'), ('match', 'U64'), ('league', 'U16'), ('market', 'U20'),
+    ('odds', 'f8'), ('stake', 'f8'), ('prediction', 'U20'), ('actual_result', 'U10'),
+    ('bet_won', '?'), ('profit_loss', 'f8'), ('bankroll_before', 'f8'), ('bankroll_after', 'f8'),
+    ('edge', 'f8'), ('confidence', 'f8'), ('expected_value', 'f8')
+])
+
+def _process_day(stakes, potential_profits, won, max_risk):
+    """Greedy daily risk-budget selection and P&L over EV-ranked bets
+    
+    Takes each bet whose stake still fits under max_risk, in order.
+    Returns (taken mask, per-bet profit, total stakes, daily profit).
+    """
+    n = stakes.shape[0]
+    taken = np.zeros(n, dtype=np.bool_)
+    profits = np.zeros(n)
+    daily_stakes = 0.0
+    daily_profit = 0.0
+    
+    for i in range(n):
+        if daily_stakes + stakes[i] <= max_risk:
+            taken[i] = True
+            daily_stakes += stakes[i]
+            profits[i] = potential_profits[i] if won[i] else -stakes[i]
+            daily_profit += profits[i]
+    
+    return taken, profits, daily_stakes, daily_profit
+
+if NUMBA_AVAILABLE:
+    _process_day = njit(cache=True)(_process_day)
+
+
+# Prediction generator held by each worker process (set by _init_prediction_worker)
+_worker_generator = None
+
+def _init_prediction_worker(csv_generator):
+    """Keep one copy of the prediction generator per worker process"""
+    global _worker_generator
+    _worker_generator = csv_generator
+
+def _predict_chunk(match_records):
+    """Predict a chunk of matches in a worker process"""
+    return [_worker_generator.predict_betting_markets(match) for match in match_records]
 
 
 class BacktestSystem:
     """Backtest the betting strategy with historical data simulation"""
     
-    def __init__(self, api_key: str, initial_bankroll: float = 300.0, start_date: str = "2024-08-01"):
+    def __init__(self, api_key: str, initial_bankroll: float = 300.0, start_date: str = "2024-08-01",
+                 seed: int = 42, rng: np.random.Generator = None):
         self.api_key = api_key
         self.initial_bankroll = initial_bankroll
         self.current_bankroll = initial_bankroll
@@ -29,133 +155,133 @@ class BacktestSystem:
         self.end_date = datetime.now()
         
         self.manager = DailyBankrollManager(api_key, initial_bankroll)
-        self.backtest_results = []
+        # Single generator for all simulated data (seeded before generate_historical_data runs)
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
         self.daily_summaries = []
         
-        # Historical match results simulation data
+        # Bet-by-bet results: preallocated structured array, filled up to _n_bets
+        self._bets = np.empty(0, dtype=BET_DTYPE)
+        self._n_bets = 0
+        
+        # Raw per-day log entries, formatted once at report time when verbose
+        self._day_log = []
+        self.verbose = True
+        
+        # Historical match results simulation data, one row per match in date order
         # In real implementation, this would come from actual historical API data
-        self.historical_outcomes = self.generate_historical_data()
+        self.historical_df = self.generate_historical_data()
         
+    @property
+    def backtest_results(self):
+        """Bet-by-bet results recorded so far, as a DataFrame"""
+        return pd.DataFrame(self._bets[:self._n_bets])
+    
     def generate_historical_data(self):
-        """Generate historical match outcomes for backtesting"""
+        """Generate historical match outcomes for backtesting as a DataFrame"""
         
-        # Simulate historical matches for each day since August 1st
-        historical_data = {}
-        current_date = self.start_date
+        rng = self.rng
         
         print("📊 Generating historical match data for backtesting...")
         
-        while current_date <= self.end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Generate 3-8 matches per day (realistic for major leagues)
-            num_matches = random.randint(3, 8)
-            daily_matches = []
-            
-            leagues = ['Premier League', 'La Liga', 'Bundesliga', 'Serie A', 'Ligue 1', 'MLS', 'Liga MX']
-            teams = {
-                'Premier League': [
-                    ('Manchester City', 'Arsenal'), ('Liverpool', 'Chelsea'), ('Tottenham', 'Manchester United'),
-                    ('Newcastle', 'Brighton'), ('Aston Villa', 'West Ham'), ('Crystal Palace', 'Fulham')
-                ],
-                'La Liga': [
-                    ('Real Madrid', 'Barcelona'), ('Atletico Madrid', 'Valencia'), ('Sevilla', 'Real Betis'),
-                    ('Villarreal', 'Athletic Bilbao'), ('Real Sociedad', 'Getafe'), ('Osasuna', 'Celta Vigo')
-                ],
-                'Bundesliga': [
-                    ('Bayern Munich', 'Borussia Dortmund'), ('RB Leipzig', 'Bayer Leverkusen'), 
-                    ('Eintracht Frankfurt', 'VfB Stuttgart'), ('Borussia Monchengladbach', 'Wolfsburg')
-                ],
-                'Serie A': [
-                    ('Juventus', 'AC Milan'), ('Inter Milan', 'Napoli'), ('AS Roma', 'Lazio'),
-                    ('Atalanta', 'Fiorentina'), ('Bologna', 'Torino')
-                ],
-                'MLS': [
-                    ('LA Galaxy', 'LAFC'), ('Inter Miami', 'New York City FC'), ('Seattle Sounders', 'Portland Timbers')
-                ],
-                'Liga MX': [
-                    ('Club America', 'Chivas'), ('Cruz Azul', 'Pumas'), ('Monterrey', 'Tigres')
-                ]
-            }
+        # Every day since August 1st, and 3-8 match slots per day (realistic for major leagues)
+        day_dates = pd.date_range(self.start_date, self.end_date, freq='D').strftime("%Y-%m-%d")
+        n_per_day = rng.integers(3, 9, size=len(day_dates))
+        slot_dates = np.repeat(day_dates.to_numpy(), n_per_day)
+        
+        # League per slot; slots drawn for a league without fixtures stay empty
+        league_idx = rng.integers(0, len(BACKTEST_LEAGUES), size=len(slot_dates))
+        has_fixtures = FIXTURE_COUNTS[league_idx] > 0
+        dates = slot_dates[has_fixtures]
+        league_idx = league_idx[has_fixtures]
+        total = len(league_idx)
+        
+        # Fixture per match from the flattened table
+        pair_idx = FIXTURE_OFFSETS[league_idx] + rng.integers(0, FIXTURE_COUNTS[league_idx])
+        
+        # Generate realistic odds
+        home_odds = rng.uniform(1.5, 4.5, total).round(2)
+        away_odds = rng.uniform(1.5, 4.5, total).round(2)
+        draw_odds = rng.uniform(2.8, 3.8, total).round(2)
+        
+        # Generate other market odds
+        btts_yes_odds = rng.uniform(1.6, 2.2, total).round(2)
+        btts_no_odds = rng.uniform(1.7, 2.3, total).round(2)
+        over_25_odds = rng.uniform(1.4, 2.5, total).round(2)
+        under_25_odds = rng.uniform(1.5, 2.8, total).round(2)
+        
+        # Normalized odds-implied probabilities (rows: home, draw, away), kept for reuse
+        inv = 1.0 / np.stack([home_odds, draw_odds, away_odds])
+        self.implied_probs = inv / inv.sum(0, keepdims=True)
+        
+        # Simulate actual match outcome: position of the draw among the cumulative probabilities
+        rand = rng.random(total)
+        outcome = (rand >= self.implied_probs[:2].cumsum(0)).sum(0)
+        home_win = outcome == 0
+        draw = outcome == 1
+        actual_result = OUTCOMES[outcome]
+        
+        # Scorelines drawn from the winner/loser/draw pools
+        winner_goals = rng.choice(WINNER_GOALS, total)
+        loser_goals = rng.choice(LOSER_GOALS, total)
+        draw_goals = rng.choice(DRAW_GOALS, total)
+        home_score = np.select([home_win, draw], [winner_goals, draw_goals], loser_goals)
+        away_score = np.select([home_win, draw], [loser_goals, draw_goals], winner_goals)
+        
+        total_goals = home_score + away_score
+        btts_result = (home_score > 0) & (away_score > 0)
+        
+        return pd.DataFrame({
+            'date': dates,
+            'time': pd.Series(rng.integers(12, 23, total)).map('{:02d}:00'.format),
+            'league': np.array(BACKTEST_LEAGUES, dtype=object)[league_idx],
+            'home_team': FIXTURE_HOME[pair_idx],
+            'away_team': FIXTURE_AWAY[pair_idx],
+            'home_odds': home_odds,
+            'draw_odds': draw_odds,
+            'away_odds': away_odds,
+            'btts_yes_odds': btts_yes_odds,
+            'btts_no_odds': btts_no_odds,
+            'over_25_odds': over_25_odds,
+            'under_25_odds': under_25_odds,
             
-            for i in range(num_matches):
-                league = random.choice(leagues)
-                if league in teams:
-                    home_team, away_team = random.choice(teams[league])
-                    
-                    # Generate realistic odds
-                    home_odds = round(random.uniform(1.5, 4.5), 2)
-                    away_odds = round(random.uniform(1.5, 4.5), 2)
-                    draw_odds = round(random.uniform(2.8, 3.8), 2)
-                    
-                    # Generate other market odds
-                    btts_yes_odds = round(random.uniform(1.6, 2.2), 2)
-                    btts_no_odds = round(random.uniform(1.7, 2.3), 2)
-                    over_25_odds = round(random.uniform(1.4, 2.5), 2)
-                    under_25_odds = round(random.uniform(1.5, 2.8), 2)
-                    
-                    # Simulate actual match outcome based on odds probabilities
-                    home_prob = 1 / home_odds
-                    draw_prob = 1 / draw_odds  
-                    away_prob = 1 / away_odds
-                    
-                    # Normalize probabilities
-                    total_prob = home_prob + draw_prob + away_prob
-                    home_prob /= total_prob
-                    draw_prob /= total_prob
-                    away_prob /= total_prob
-                    
-                    # Determine actual outcome
-                    rand = random.random()
-                    if rand < home_prob:
-                        actual_result = 'Home Win'
-                        home_score = random.choice([1, 2, 2, 3, 3, 4])
-                        away_score = random.choice([0, 0, 1, 1, 2])
-                    elif rand < home_prob + draw_prob:
-                        actual_result = 'Draw'
-                        score = random.choice([0, 1, 1, 2, 2])
-                        home_score = away_score = score
-                    else:
-                        actual_result = 'Away Win'
-                        away_score = random.choice([1, 2, 2, 3, 3, 4])
-                        home_score = random.choice([0, 0, 1, 1, 2])
-                    
-                    total_goals = home_score + away_score
-                    btts_result = home_score > 0 and away_score > 0
-                    
-                    match_data = {
-                        'date': date_str,
-                        'time': f"{random.randint(12, 22):02d}:00",
-                        'league': league,
-                        'home_team': home_team,
-                        'away_team': away_team,
-                        'home_odds': home_odds,
-                        'draw_odds': draw_odds,
-                        'away_odds': away_odds,
-                        'btts_yes_odds': btts_yes_odds,
-                        'btts_no_odds': btts_no_odds,
-                        'over_25_odds': over_25_odds,
-                        'under_25_odds': under_25_odds,
-                        
-                        # Actual results
-                        'actual_result': actual_result,
-                        'home_score': home_score,
-                        'away_score': away_score,
-                        'total_goals': total_goals,
-                        'btts_actual': 'YES' if btts_result else 'NO',
-                        'over_25_actual': 'OVER' if total_goals > 2.5 else 'UNDER'
-                    }
-                    
-                    daily_matches.append(match_data)
+            # Actual results
+            'actual_result': actual_result,
+            'home_score': home_score,
+            'away_score': away_score,
+            'total_goals': total_goals,
+            'btts_actual': np.where(btts_result, 'YES', 'NO'),
+            'over_25_actual': np.where(total_goals > 2.5, 'OVER', 'UNDER')
+        })
+    
+    def predict_all_matches(self, workers=1):
+        """Predictions for every historical match, in historical_df row order
+        
+        Predictions don't depend on the bankroll, so with workers > 1 the matches
+        are predicted month by month in a process pool. Bet sizing and selection
+        depend on the running bankroll and stay serial in run_backtest.
+        """
+        records = self.historical_df.to_dict('records')
+        generator = self.manager.csv_generator
+        
+        if workers <= 1:
+            predictions = [generator.predict_betting_markets(match) for match in records]
+        else:
+            # Month chunks; history is in date order, so results concatenate back in row order
+            months = self.historical_df['date'].str[:7].to_numpy()
+            bounds = np.flatnonzero(months[1:] != months[:-1]) + 1
+            chunks = [records[start:end] for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(records)])]
             
-            historical_data[date_str] = daily_matches
-            current_date += timedelta(days=1)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_prediction_worker,
+                                     initargs=(generator,)) as executor:
+                predictions = [prediction for chunk in executor.map(_predict_chunk, chunks) for prediction in chunk]
         
-        return historical_data
+        return pd.DataFrame(predictions, index=self.historical_df.index)
     
-    def run_backtest(self, max_bets_per_day=5):
+    def run_backtest(self, max_bets_per_day=5, workers=1, verbose=True):
         """Run the complete backtest simulation"""
         
+        self.verbose = verbose
+        
         print(f"🎯 Starting Backtest Simulation")
         print(f"=" * 50)
         print(f"📅 Period: {self.start_date.strftime('%Y-%m-%d')} to {self.end_date.strftime('%Y-%m-%d')}")
@@ -168,164 +294,188 @@ class BacktestSystem:
         if not self.manager.load_models():
             print("⚠️  No models loaded - using basic calculations")
         
-        current_date = self.start_date
-        total_days = 0
+        # Predict every match of the period in one pass (model calls stay per match)
+        matches = self.historical_df
+        predictions = self.predict_all_matches(workers)
+        outcomes = matches[OUTCOME_COLUMNS]
+        
+        # Every qualifying (match, market) bet of the period with its Kelly fraction,
+        # evaluated once; only the bankroll-dependent sizing is redone per day
+        opportunities = self.manager.evaluate_bet_opportunities_batch(predictions)
+        if opportunities.empty:
+            opportunities = pd.DataFrame(columns=['date', 'kelly_fraction', 'odds', 'probability'])
+        kelly = opportunities['kelly_fraction'].to_numpy(dtype=np.float64)
+        odds = opportunities['odds'].to_numpy(dtype=np.float64)
+        probability = opportunities['probability'].to_numpy(dtype=np.float64)
+        
+        # Calendar of the period, and each day's [start, end) range of opportunity rows
+        # (rows are in date order, so ISO date strings can be binary-searched; empty days get start == end)
+        calendar = pd.date_range(self.start_date, self.end_date, freq='D')
+        calendar_str = calendar.strftime("%Y-%m-%d").to_numpy(dtype='U10')
+        opp_dates = opportunities['date'].to_numpy(dtype='U10')
+        day_starts = np.searchsorted(opp_dates, calendar_str, side='left')
+        day_ends = np.searchsorted(opp_dates, calendar_str, side='right')
+        
+        # Whether each market won, for every match, computed once for the whole backtest
+        win_masks = self.build_win_masks(matches)
+        
+        # Result records sized for the most bets the run can place
+        capacity = len(calendar) * max_bets_per_day
+        self._bets = np.empty(capacity, dtype=BET_DTYPE)
+        self._n_bets = 0
+        
+        self._day_log = []
+        log_day = self._day_log.append
+        
+        total_days = len(calendar)
         days_with_bets = 0
         total_bets = 0
         
-        while current_date <= self.end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            total_days += 1
+        for current_date, date_str, day_start, day_end in zip(
+            calendar.to_pydatetime(), calendar_str.tolist(), day_starts.tolist(), day_ends.tolist()
+        ):
+            starting_bankroll = self.current_bankroll
+            
+            # Update manager's bankroll
+            self.manager.current_bankroll = self.current_bankroll
             
-            if date_str in self.historical_outcomes:
-                daily_matches = self.historical_outcomes[date_str]
+            if day_start < day_end:
+                day = slice(day_start, day_end)
                 
-                print(f"\n📅 {date_str} ({current_date.strftime('%A')})")
-                print(f"💼 Bankroll: ${self.current_bankroll:.2f}")
+                # Size the day's bets against the current bankroll in one array pass
+                bet_size, potential_profit, ev = self.manager.size_bets(kelly[day], odds[day], probability[day])
                 
-                # Update manager's bankroll
-                self.manager.current_bankroll = self.current_bankroll
+                # Top N by expected value: partial selection, then a stable sort of just those
+                # (ties keep match/market order)
+                top = np.arange(ev.size)
+                if top.size > max_bets_per_day:
+                    top = np.argpartition(-ev, max_bets_per_day)[:max_bets_per_day]
+                top = top[np.lexsort((top, -ev[top]))]
                 
-                # Generate predictions for all matches
-                daily_opportunities = []
-                for match in daily_matches:
-                    # Get predictions
-                    prediction = self.manager.csv_generator.predict_betting_markets(match)
-                    
-                    # Get betting opportunities
-                    opportunities = self.manager.evaluate_bet_opportunity(prediction)
-                    
-                    # Add actual results to opportunities
-                    for opp in opportunities:
-                        opp['actual_result'] = match['actual_result']
-                        opp['home_score'] = match['home_score']
-                        opp['away_score'] = match['away_score']
-                        opp['btts_actual'] = match['btts_actual']
-                        opp['over_25_actual'] = match['over_25_actual']
-                        
-                    daily_opportunities.extend(opportunities)
+                # Selected bets with actual results attached, and whether each won
+                selected = opportunities.iloc[day].iloc[top].join(outcomes, on='match_idx')
+                won = np.array([
+                    win_masks[market][row] for market, row in zip(selected['market'], selected['match_idx'])
+                ], dtype=bool)
+                
+                # Daily risk limit, bet results and P&L in one pass over the ranked bets
+                max_daily_risk = self.current_bankroll * 0.25
+                taken, profits, daily_stakes, daily_profit = _process_day(
+                    bet_size[top], potential_profit[top], won, max_daily_risk
+                )
+                final_bets = selected[taken]
+                won = won[taken]
+                profits = profits[taken]
+                num_bets = len(final_bets)
                 
-                if daily_opportunities:
-                    # Sort by expected value and select top N
-                    daily_opportunities.sort(key=lambda x: x['expected_value'], reverse=True)
-                    selected_bets = daily_opportunities[:max_bets_per_day]
+                if num_bets:
+                    days_with_bets += 1
+                    stakes = bet_size[top][taken]
+                    expected_value = ev[top][taken]
+                    total_bets += num_bets
                     
-                    # Apply daily risk limit
-                    max_daily_risk = self.current_bankroll * 0.25
-                    final_bets = []
-                    daily_stakes = 0
+                    # Record bet details: the day's bets written into the structured array as one block
+                    start, end = self._n_bets, self._n_bets + num_bets
+                    day_bets = self._bets[start:end]
+                    day_bets['date'] = date_str
+                    day_bets['match'] = final_bets['match'].to_numpy()
+                    day_bets['league'] = final_bets['league'].to_numpy()
+                    day_bets['market'] = final_bets['market'].to_numpy()
+                    day_bets['odds'] = final_bets['odds'].to_numpy()
+                    day_bets['stake'] = stakes
+                    day_bets['prediction'] = final_bets['market'].to_numpy()
+                    day_bets['actual_result'] = final_bets['actual_result'].to_numpy()
+                    day_bets['bet_won'] = won
+                    day_bets['profit_loss'] = profits
+                    day_bets['bankroll_before'] = self.current_bankroll
+                    day_bets['bankroll_after'] = self.current_bankroll + profits
+                    day_bets['edge'] = final_bets['edge'].to_numpy()
+                    day_bets['confidence'] = final_bets['confidence'].to_numpy()
+                    day_bets['expected_value'] = expected_value
+                    self._n_bets = end
                     
-                    for bet in selected_bets:
-                        if daily_stakes + bet['bet_size'] <= max_daily_risk:
-                            final_bets.append(bet)
-                            daily_stakes += bet['bet_size']
+                    # Update bankroll
+                    self.current_bankroll += daily_profit
                     
-                    if final_bets:
-                        days_with_bets += 1
-                        print(f"🎯 Selected {len(final_bets)} bets (${daily_stakes:.2f} total stakes)")
-                        
-                        # Process each bet
-                        daily_profit = 0
-                        daily_bets = []
-                        
-                        for i, bet in enumerate(final_bets, 1):
-                            # Determine if bet won
-                            bet_won = self.determine_bet_result(bet)
-                            
-                            if bet_won:
-                                profit = bet['potential_profit']
-                                print(f"   ✅ BET {i}: WON ${profit:.2f}")
-                            else:
-                                profit = -bet['bet_size']
-                                print(f"   ❌ BET {i}: LOST ${bet['bet_size']:.2f}")
-                            
-                            daily_profit += profit
-                            total_bets += 1
-                            
-                            # Record bet details
-                            bet_record = {
-                                'date': date_str,
-                                'match': bet['match'],
-                                'league': bet['league'],
-                                'market': bet['market'],
-                                'odds': bet['odds'],
-                                'stake': bet['bet_size'],
-                                'prediction': bet['market'],
-                                'actual_result': bet['actual_result'],
-                                'bet_won': bet_won,
-                                'profit_loss': profit,
-                                'bankroll_before': self.current_bankroll,
-                                'bankroll_after': self.current_bankroll + profit,
-                                'edge': bet['edge'],
-                                'confidence': bet['confidence'],
-                                'expected_value': bet['expected_value']
-                            }
-                            
-                            self.backtest_results.append(bet_record)
-                            daily_bets.append(bet_record)
-                        
-                        # Update bankroll
-                        self.current_bankroll += daily_profit
-                        
-                        print(f"📊 Daily P&L: ${daily_profit:.2f}")
-                        print(f"💼 New Bankroll: ${self.current_bankroll:.2f}")
-                        
-                        # Daily summary
-                        daily_summary = {
-                            'date': date_str,
-                            'starting_bankroll': self.current_bankroll - daily_profit,
-                            'num_bets': len(final_bets),
-                            'total_stakes': daily_stakes,
-                            'daily_profit': daily_profit,
-                            'ending_bankroll': self.current_bankroll,
-                            'roi': (daily_profit / daily_stakes * 100) if daily_stakes > 0 else 0,
-                            'bets_won': sum(1 for bet in daily_bets if bet['bet_won']),
-                            'win_rate': (sum(1 for bet in daily_bets if bet['bet_won']) / len(daily_bets)) * 100 if daily_bets else 0
-                        }
-                        self.daily_summaries.append(daily_summary)
-                    else:
-                        print("❌ No bets within risk limits")
+                    log_day((current_date, starting_bankroll, 'bets',
+                             (daily_stakes, won, profits, stakes, daily_profit, self.current_bankroll)))
+                    
+                    # Daily summary
+                    bets_won = int(won.sum())
+                    daily_summary = {
+                        'date': date_str,
+                        'starting_bankroll': self.current_bankroll - daily_profit,
+                        'num_bets': num_bets,
+                        'total_stakes': daily_stakes,
+                        'daily_profit': daily_profit,
+                        'ending_bankroll': self.current_bankroll,
+                        'roi': (daily_profit / daily_stakes * 100) if daily_stakes > 0 else 0,
+                        'bets_won': bets_won,
+                        'win_rate': (bets_won / num_bets) * 100
+                    }
+                    self.daily_summaries.append(daily_summary)
                 else:
-                    print("❌ No opportunities found")
-            
-            current_date += timedelta(days=1)
+                    log_day((current_date, starting_bankroll, 'no_bets', None))
+            else:
+                log_day((current_date, starting_bankroll, 'no_opportunities', None))
         
         # Generate final results
         self.generate_backtest_report(total_days, days_with_bets, total_bets)
         return self.backtest_results
     
+    def format_day_log(self):
+        """Per-day backtest log lines, formatted from the recorded day entries"""
+        
+        lines = []
+        emit = lines.append
+        
+        for day, bankroll, status, details in self._day_log:
+            emit(f"\n📅 {day.strftime('%Y-%m-%d')} ({day.strftime('%A')})")
+            emit(f"💼 Bankroll: ${bankroll:.2f}")
+            
+            if status == 'no_opportunities':
+                emit("❌ No opportunities found")
+            elif status == 'no_bets':
+                emit("❌ No bets within risk limits")
+            else:
+                daily_stakes, won, profits, stakes, daily_profit, new_bankroll = details
+                emit(f"🎯 Selected {len(won)} bets (${daily_stakes:.2f} total stakes)")
+                for i, (bet_won, profit, stake) in enumerate(zip(won.tolist(), profits.tolist(), stakes.tolist()), 1):
+                    if bet_won:
+                        emit(f"   ✅ BET {i}: WON ${profit:.2f}")
+                    else:
+                        emit(f"   ❌ BET {i}: LOST ${stake:.2f}")
+                emit(f"📊 Daily P&L: ${daily_profit:.2f}")
+                emit(f"💼 New Bankroll: ${new_bankroll:.2f}")
+        
+        return lines
+    
+    def build_win_masks(self, matches):
+        """Boolean win array per market over all matches"""
+        return {
+            market: matches[column].to_numpy() == value
+            for market, (column, value) in WIN_CONDITIONS.items()
+        }
+    
     def determine_bet_result(self, bet):
         """Determine if a bet won based on actual results"""
         
-        market = bet['market']
-        actual_result = bet['actual_result']
-        
-        # 1X2 Markets
-        if market == 'Home Win':
-            return actual_result == 'Home Win'
-        elif market == 'Away Win':
-            return actual_result == 'Away Win'
-        elif market == 'Draw':
-            return actual_result == 'Draw'
-        
-        # BTTS Markets
-        elif market == 'BTTS Yes':
-            return bet['btts_actual'] == 'YES'
-        elif market == 'BTTS No':
-            return bet['btts_actual'] == 'NO'
-        
-        # Goals Markets
-        elif market == 'Over 2.5 Goals':
-            return bet['over_25_actual'] == 'OVER'
-        elif market == 'Under 2.5 Goals':
-            return bet['over_25_actual'] == 'UNDER'
+        condition = WIN_CONDITIONS.get(bet['market'])
         
         # Default to loss if market not recognized
-        return False
+        if condition is None:
+            return False
+        
+        column, value = condition
+        return bet[column] == value
     
     def generate_backtest_report(self, total_days, days_with_bets, total_bets):
         """Generate comprehensive backtest report"""
         
+        # Day-by-day log, formatted and written in one go (skipped entirely when not verbose)
+        if self.verbose and self._day_log:
+            sys.stdout.write('\n'.join(self.format_day_log()) + '\n')
+        
         print(f"\n" + "=" * 70)
         print(f"📊 BACKTEST RESULTS SUMMARY")
         print(f"=" * 70)
@@ -340,11 +490,13 @@ class BacktestSystem:
         print(f"   Total Profit/Loss: ${total_profit:.2f}")
         print(f"   Total ROI: {total_roi:.2f}%")
         
+        bets = self._bets[:self._n_bets]
+        
         # Betting statistics
-        if self.backtest_results:
-            total_stakes = sum(bet['stake'] for bet in self.backtest_results)
-            bets_won = sum(1 for bet in self.backtest_results if bet['bet_won'])
-            win_rate = (bets_won / len(self.backtest_results)) * 100
+        if bets.size:
+            total_stakes = float(bets['stake'].sum())
+            bets_won = int(bets['bet_won'].sum())
+            win_rate = (bets_won / bets.size) * 100
             
             print(f"\n📊 BETTING STATISTICS:")
             print(f"   Total Days: {total_days}")
@@ -358,54 +510,62 @@ class BacktestSystem:
             
             # Best and worst days
             if self.daily_summaries:
-                best_day = max(self.daily_summaries, key=lambda x: x['daily_profit'])
-                worst_day = min(self.daily_summaries, key=lambda x: x['daily_profit'])
+                daily_profits = np.array([day['daily_profit'] for day in self.daily_summaries])
+                best_day = self.daily_summaries[daily_profits.argmax()]
+                worst_day = self.daily_summaries[daily_profits.argmin()]
                 
                 print(f"\n📈 BEST & WORST DAYS:")
                 print(f"   Best Day: {best_day['date']} (+${best_day['daily_profit']:.2f})")
                 print(f"   Worst Day: {worst_day['date']} (${worst_day['daily_profit']:.2f})")
                 
                 # Profitability streak
-                profitable_days = sum(1 for day in self.daily_summaries if day['daily_profit'] > 0)
+                profitable_days = int((daily_profits > 0).sum())
                 profitability_rate = (profitable_days / len(self.daily_summaries)) * 100
                 print(f"   Profitable Days: {profitable_days}/{len(self.daily_summaries)} ({profitability_rate:.1f}%)")
         
         # Market performance
-        market_performance = {}
-        for bet in self.backtest_results:
-            market = bet['market']
-            if market not in market_performance:
-                market_performance[market] = {'bets': 0, 'won': 0, 'profit': 0, 'stakes': 0}
+        if bets.size:
+            market_stats = self.backtest_results.groupby('market').agg(
+                bets=('stake', 'size'),
+                stakes=('stake', 'sum'),
+                profit=('profit_loss', 'sum'),
+                won=('bet_won', 'sum')
+            ).sort_values('profit', ascending=False, kind='stable')
+            market_stats['win_rate'] = market_stats['won'] / market_stats['bets'] * 100
+            stakes = market_stats['stakes']
+            market_stats['roi'] = (market_stats['profit'] / stakes.where(stakes > 0) * 100).fillna(0)
             
-            market_performance[market]['bets'] += 1
-            market_performance[market]['stakes'] += bet['stake']
-            market_performance[market]['profit'] += bet['profit_loss']
-            if bet['bet_won']:
-                market_performance[market]['won'] += 1
-        
-        if market_performance:
             print(f"\n🎯 MARKET PERFORMANCE:")
-            for market, stats in sorted(market_performance.items(), key=lambda x: x[1]['profit'], reverse=True):
-                win_rate = (stats['won'] / stats['bets']) * 100
-                roi = (stats['profit'] / stats['stakes']) * 100 if stats['stakes'] > 0 else 0
-                print(f"   {market}: {stats['bets']} bets, {win_rate:.1f}% wins, ${stats['profit']:.2f} profit ({roi:.1f}% ROI)")
+            for market, n_bets, _, profit, _, win_rate, roi in market_stats.itertuples(index=True, name=None):
+                print(f"   {market}: {n_bets} bets, {win_rate:.1f}% wins, ${profit:.2f} profit ({roi:.1f}% ROI)")
     
-    def save_backtest_results(self):
-        """Save detailed backtest results to CSV files"""
-        
-        if self.backtest_results:
-            # Detailed bet-by-bet results
-            results_df = pd.DataFrame(self.backtest_results)
-            results_filename = f"backtest_detailed_{self.start_date.strftime('%Y%m%d')}_{self.end_date.strftime('%Y%m%d')}.csv"
-            results_path = f"/Users/richardgibbons/soccer betting python/{results_filename}"
+    def save_backtest_results(self, output_dir=RESULTS_DIR):
+        """Save detailed backtest results to CSV files
+        
+        The detailed results are also written as zstd-compressed Parquet when
+        pyarrow is installed (analyze_backtest.py reads that copy when present).
+        """
+        
+        if self._n_bets:
+            period = f"{self.start_date.strftime('%Y%m%d')}_{self.end_date.strftime('%Y%m%d')}"
+            
+            # Detailed bet-by-bet results (frame over the filled records)
+            results_df = self.backtest_results
+            results_filename = f"backtest_detailed_{period}.csv"
+            results_path = os.path.join(output_dir, results_filename)
             results_df.to_csv(results_path, index=False)
             print(f"\n💾 Detailed results saved to: {results_filename}")
             
+            if PYARROW_AVAILABLE:
+                parquet_path = os.path.splitext(results_path)[0] + '.parquet'
+                results_df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+                print(f"💾 Parquet copy saved to: {os.path.basename(parquet_path)}")
+            
             # Daily summaries
             if self.daily_summaries:
                 summary_df = pd.DataFrame(self.daily_summaries)
-                summary_filename = f"backtest_daily_summary_{self.start_date.strftime('%Y%m%d')}_{self.end_date.strftime('%Y%m%d')}.csv"
-                summary_path = f"/Users/richardgibbons/soccer betting python/{summary_filename}"
+                summary_filename = f"backtest_daily_summary_{period}.csv"
+                summary_path = os.path.join(output_dir, summary_filename)
                 summary_df.to_csv(summary_path, index=False)
                 print(f"💾 Daily summaries saved to: {summary_filename}")
                 
@@ -413,7 +573,6 @@ class BacktestSystem:
         
         return None, None
 
-
 def main():
     """Main function to run the backtest"""
     
@@ -421,6 +580,9 @@ def main():
     INITIAL_BANKROLL = 300.0
     START_DATE = "2024-08-01"
     MAX_DAILY_BETS = 5
+    SEED = 42
+    WORKERS = os.cpu_count() or 1
+    OUTPUT_DIR = os.environ.get('BACKTEST_OUTPUT_DIR', RESULTS_DIR)
     
     print("🎯 Soccer Betting Strategy Backtest")
     print("=" * 45)
@@ -431,25 +593,21 @@ def main():
     print(f"⚖️  Maximum daily risk: 25% of bankroll")
     print("=" * 45)
     
-    # Initialize and run backtest
-    backtester = BacktestSystem(API_KEY, INITIAL_BANKROLL, START_DATE)
-    
-    # Set random seed for consistent results (remove in production)
-    random.seed(42)
-    np.random.seed(42)
+    # Initialize and run backtest (seeded for consistent results)
+    backtester = BacktestSystem(API_KEY, INITIAL_BANKROLL, START_DATE, seed=SEED)
     
     # Run the backtest
-    results = backtester.run_backtest(MAX_DAILY_BETS)
+    results = backtester.run_backtest(MAX_DAILY_BETS, workers=WORKERS)
     
     # Save results to files
-    detailed_file, summary_file = backtester.save_backtest_results()
+    detailed_file, summary_file = backtester.save_backtest_results(OUTPUT_DIR)
     
     print(f"\n🎉 Backtest Complete!")
     print(f"📁 Check your files:")
     if detailed_file:
-        print(f"   📊 Detailed Results: {detailed_file.split('/')[-1]}")
+        print(f"   📊 Detailed Results: {os.path.basename(detailed_file)}")
     if summary_file:
-        print(f"   📈 Daily Summary: {summary_file.split('/')[-1]}")
+        print(f"   📈 Daily Summary: {os.path.basename(summary_file)}")
     
     print(f"\n💡 Use these files to:")
     print(f"   • Analyze bet-by-bet performance")
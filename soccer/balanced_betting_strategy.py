@@ -8,7 +8,7 @@ Based on backtest analysis but less restrictive to ensure daily opportunities.
 """
 
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Union
 import numpy as np
 
 class BalancedBettingStrategy:
@@ -17,14 +17,14 @@ class BalancedBettingStrategy:
     def __init__(self):
         
         # WORST PERFORMERS TO AVOID (from backtest data)
-        self.banned_markets = {
+        self.banned_markets = frozenset({
             'Under 2.5 Goals'     # -76.0% ROI, 20.0% win rate - TERRIBLE  
-        }
+        })
         
         # DE-PRIORITIZE but don't ban completely
-        self.low_priority_markets = {
+        self.low_priority_markets = frozenset({
             'Draw'               # -56.6% ROI, 26.7% win rate - Poor but not banned
-        }
+        })
         
         # BALANCED CONFIDENCE RANGE - not too restrictive
         self.confidence_range = (0.52, 0.88)  # Wider range for more opportunities
@@ -36,10 +36,10 @@ class BalancedBettingStrategy:
         self.min_quality_score = 0.0     # Disabled to ensure picks are generated
         
         # PROBLEMATIC LEAGUES TO DEPRIORITIZE (not ban)
-        self.low_priority_leagues = {
+        self.low_priority_leagues = frozenset({
             'MLS',               # -$177 loss in backtest
             'Serie A'            # -$121 loss in backtest
-        }
+        })
         
         print("⚖️ BALANCED BETTING STRATEGY LOADED")
         print(f"❌ Banned Markets: {', '.join(self.banned_markets) if self.banned_markets else 'None'}")
@@ -49,73 +49,80 @@ class BalancedBettingStrategy:
         print(f"⭐ Min Quality: {self.min_quality_score}")
         print()
     
-    def apply_balanced_filtering(self, opportunities: List[Dict]) -> List[Dict]:
-        """Apply balanced filtering that generates picks while avoiding worst performers"""
+    def apply_balanced_filtering(self, opportunities: Union[List[Dict], pd.DataFrame]) -> Union[List[Dict], pd.DataFrame]:
+        """Apply balanced filtering that generates picks while avoiding worst performers
         
-        if not opportunities:
-            return []
+        Accepts a list of opportunity dicts or a DataFrame and returns the same
+        kind, filtered and sorted by balanced score (highest first). Filters and
+        scores are computed as column masks over all opportunities at once.
+        """
+        
+        is_frame = isinstance(opportunities, pd.DataFrame)
+        if len(opportunities) == 0:
+            return opportunities.copy() if is_frame else []
         
         print(f"⚖️ APPLYING BALANCED FILTERS to {len(opportunities)} opportunities...")
         
-        filtered_opportunities = []
-        rejection_reasons = {
-            'banned_market': 0,
-            'confidence_out_of_range': 0, 
-            'low_edge': 0,
-            'low_quality': 0
-        }
-        
-        for opp in opportunities:
-            # Extract values
-            market = opp.get('market', '').strip()
-            confidence = opp.get('confidence', 0)
-            edge = opp.get('edge', 0)
-            league = opp.get('league', '').strip()
-            quality_score = opp.get('quality_score', 0)
-            
+        df = opportunities if is_frame else pd.DataFrame.from_records(opportunities)
+        
+        def column(name, default):
+            if name in df:
+                return df[name].fillna(default)
+            return pd.Series(default, index=df.index)
+        
+        # Extract values (market and league names arrive canonical from the producer)
+        market = column('market', '')
+        league = column('league', '')
+        confidence = column('confidence', 0).to_numpy(dtype=np.float64)
+        edge = column('edge', 0).to_numpy(dtype=np.float64)
+        quality_score = column('quality_score', 0).to_numpy(dtype=np.float64)
+        
+        filter_stages = (
             # 1. ONLY BAN THE WORST MARKET
-            if market in self.banned_markets:
-                rejection_reasons['banned_market'] += 1
-                continue
-            
+            ('banned_market', market.isin(self.banned_markets).to_numpy()),
             # 2. CONFIDENCE RANGE - wider than improved strategy
-            if not (self.confidence_range[0] <= confidence <= self.confidence_range[1]):
-                rejection_reasons['confidence_out_of_range'] += 1
-                continue
-            
+            ('confidence_out_of_range',
+             ~((self.confidence_range[0] <= confidence) & (confidence <= self.confidence_range[1]))),
             # 3. EDGE REQUIREMENT - much more relaxed
-            if edge < self.min_edge:
-                rejection_reasons['low_edge'] += 1
-                continue
-            
+            ('low_edge', edge < self.min_edge),
             # 4. QUALITY SCORE - relaxed threshold
-            if quality_score < self.min_quality_score:
-                rejection_reasons['low_quality'] += 1
-                continue
-            
-            # 5. APPLY SCORING ADJUSTMENTS for prioritization
-            adjusted_opp = opp.copy()
-            
-            # Penalize low priority markets and leagues (but don't exclude)
-            priority_penalty = 0
-            if market in self.low_priority_markets:
-                priority_penalty += 0.1
-            if league in self.low_priority_leagues:
-                priority_penalty += 0.05
-                
-            # Create balanced score combining multiple factors
-            balanced_score = (
-                confidence * 0.4 +        # 40% weight on confidence
-                edge * 0.3 +              # 30% weight on edge
-                quality_score * 0.2 +     # 20% weight on quality
-                (1.0 - priority_penalty) * 0.1  # 10% adjustment for market/league priority
-            )
-            
-            adjusted_opp['balanced_score'] = balanced_score
-            filtered_opportunities.append(adjusted_opp)
-        
-        # Sort by balanced score (highest first)
-        filtered_opportunities.sort(key=lambda x: x.get('balanced_score', 0), reverse=True)
+            ('low_quality', quality_score < self.min_quality_score)
+        )
+        
+        # Each opportunity is counted against the first filter it fails
+        passed = np.ones(len(df), dtype=bool)
+        rejection_reasons = {}
+        for reason, failed in filter_stages:
+            rejection_reasons[reason] = int((passed & failed).sum())
+            passed &= ~failed
+        
+        # 5. APPLY SCORING ADJUSTMENTS for prioritization
+        # Penalize low priority markets and leagues (but don't exclude)
+        priority_penalty = (
+            np.where(market.isin(self.low_priority_markets).to_numpy(), 0.1, 0.0) +
+            np.where(league.isin(self.low_priority_leagues).to_numpy(), 0.05, 0.0)
+        )
+        
+        # Create balanced score combining multiple factors
+        balanced_score = (
+            confidence * 0.4 +        # 40% weight on confidence
+            edge * 0.3 +              # 30% weight on edge
+            quality_score * 0.2 +     # 20% weight on quality
+            (1.0 - priority_penalty) * 0.1  # 10% adjustment for market/league priority
+        )
+        
+        # Sort by balanced score (highest first, ties keep input order)
+        order = np.flatnonzero(passed)
+        order = order[np.argsort(-balanced_score[order], kind='stable')]
+        
+        if is_frame:
+            filtered_opportunities = df.iloc[order].assign(balanced_score=balanced_score[order])
+            top_opportunities = filtered_opportunities.head(5).to_dict('records')
+        else:
+            filtered_opportunities = [
+                {**opportunities[i], 'balanced_score': float(balanced_score[i])} for i in order
+            ]
+            top_opportunities = filtered_opportunities[:5]
         
         print(f"📊 BALANCED FILTERING RESULTS:")
         print(f"   ✅ Passed: {len(filtered_opportunities)} opportunities")
@@ -131,9 +138,9 @@ class BalancedBettingStrategy:
             print()
         
         # Show top opportunities
-        if filtered_opportunities:
+        if top_opportunities:
             print(f"🏆 TOP BALANCED OPPORTUNITIES:")
-            for i, opp in enumerate(filtered_opportunities[:5]):
+            for i, opp in enumerate(top_opportunities):
                 market = opp.get('market', 'Unknown')
                 home = opp.get('home_team', 'Unknown')
                 away = opp.get('away_team', 'Unknown')
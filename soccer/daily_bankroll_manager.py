@@ -13,6 +13,26 @@ import json
 from csv_predictions_generator import CSVPredictionsGenerator
 from multi_league_predictor import MultiLeaguePredictor
 
+# Markets checked by evaluate_bet_opportunity:
+# (name, probability column, odds column, default odds, value column, confidence column or fixed value)
+BET_MARKETS = (
+    ('Home Win', 'home_win_prob', 'home_odds', None, 'home_value', 'winner_confidence'),
+    ('Draw', 'draw_prob', 'draw_odds', None, 'draw_value', 'winner_confidence'),
+    ('Away Win', 'away_win_prob', 'away_odds', None, 'away_value', 'winner_confidence'),
+    ('BTTS Yes', 'btts_yes_prob', 'btts_yes_odds', 1.9, 'btts_yes_value', 'btts_confidence'),
+    ('BTTS No', 'btts_no_prob', 'btts_no_odds', 1.9, 'btts_no_value', 'btts_confidence'),
+    ('Over 2.5 Goals', 'over_2_5_prob', 'over_25_odds', 1.8, 'over_25_value', 0.7),
+    ('Under 2.5 Goals', 'under_2_5_prob', 'under_25_odds', 2.0, 'under_25_value', 0.7),
+)
+
+# Market-type risk added by calculate_risk_rating (BTTS slightly, goals markets more volatile)
+BET_MARKET_RISK = np.array([
+    0.05 if 'BTTS' in market[0] else 0.1 if 'Goals' in market[0] else 0.0
+    for market in BET_MARKETS
+])
+
+RISK_RATINGS = np.array(['Low', 'Medium', 'High'])
+
 
 class DailyBankrollManager:
     """Manage daily betting recommendations with bankroll management"""
@@ -161,6 +181,99 @@ class DailyBankrollManager:
         
         return opportunities
     
+    def evaluate_bet_opportunities_batch(self, predictions):
+        """Evaluate all markets for many prediction rows at once
+        
+        Vectorized counterpart of evaluate_bet_opportunity for a DataFrame of
+        prediction records: same criteria, Kelly sizing and risk rating, computed
+        as array ops over a (matches x markets) grid. Returns one row per
+        qualifying bet in match order, then market order, with `match_idx`
+        holding the prediction row's index label.
+        """
+        if predictions.empty:
+            return pd.DataFrame()
+        
+        n = len(predictions)
+        
+        def column(key, default=None):
+            if isinstance(key, float):
+                return np.full(n, key)
+            if key in predictions:
+                values = predictions[key].to_numpy(dtype=np.float64)
+                return values if default is None else np.where(np.isnan(values), default, values)
+            return np.full(n, np.nan if default is None else default)
+        
+        probability = np.column_stack([column(m[1]) for m in BET_MARKETS])
+        odds = np.column_stack([column(m[2], m[3]) for m in BET_MARKETS])
+        value = np.column_stack([column(m[4]) for m in BET_MARKETS])
+        confidence = np.column_stack([column(m[5]) for m in BET_MARKETS])
+        
+        # Same criteria as evaluate_bet_opportunity (NaN comparisons are False)
+        qualifies = (value > self.min_edge) & (confidence > self.min_confidence) & (odds > 1.2)
+        
+        # Kelly formula f = (bp - q) / b, confidence-adjusted and capped at 10%
+        with np.errstate(divide='ignore', invalid='ignore'):
+            b = odds - 1
+            kelly = (b * probability - (1 - probability)) / b * confidence
+            kelly = np.where(qualifies & (probability > 1 / odds), np.minimum(kelly, 0.10), 0.0)
+        
+        # Qualifying (match, market) cells in row-major order
+        rows, cols = np.nonzero(kelly > 0)
+        kelly = kelly[rows, cols]
+        odds = odds[rows, cols]
+        probability = probability[rows, cols]
+        confidence = confidence[rows, cols]
+        edge = value[rows, cols]
+        
+        bet_size, potential_profit, expected_value = self.size_bets(kelly, odds, probability)
+        
+        # Risk score built in the same order as calculate_risk_rating
+        risk_score = (
+            1.0
+            - np.select([edge > 0.15, edge > 0.10, edge > 0.05], [0.3, 0.2, 0.1], 0.0)
+            - np.select([confidence > 0.8, confidence > 0.7], [0.2, 0.1], 0.0)
+            + np.where((odds < 1.5) | (odds > 4.0), 0.1, 0.0)
+            + BET_MARKET_RISK[cols]
+        )
+        risk_score = np.clip(risk_score, 0.1, 1.0)
+        
+        return pd.DataFrame({
+            'match': (predictions['home_team'] + ' vs ' + predictions['away_team']).to_numpy()[rows],
+            'league': predictions['league'].to_numpy()[rows],
+            'market': np.array([m[0] for m in BET_MARKETS])[cols],
+            'odds': odds,
+            'probability': probability,
+            'confidence': confidence,
+            'edge': edge,
+            'kelly_fraction': kelly,
+            'bet_size': bet_size,
+            'potential_profit': potential_profit,
+            'expected_value': expected_value,
+            'roi': (expected_value / bet_size) * 100,
+            'risk_rating': RISK_RATINGS[np.digitize(risk_score, (0.4, 0.7))],
+            'match_time': predictions['time'].to_numpy()[rows],
+            'date': predictions['date'].to_numpy()[rows],
+            'match_idx': predictions.index.to_numpy()[rows]
+        })
+    
+    def size_bets(self, kelly, odds, probability, bankroll=None):
+        """Bet sizes, potential profits and expected values for Kelly fractions
+        
+        The Kelly fractions don't depend on the bankroll, so they can be computed
+        once and re-sized here whenever the bankroll moves. Defaults to the
+        current bankroll.
+        """
+        if bankroll is None:
+            bankroll = self.current_bankroll
+        
+        # Bet size within the minimum and maximum constraints
+        bet_size = np.maximum(self.min_bet, kelly * bankroll)
+        bet_size = np.minimum(bet_size, bankroll * self.max_bet_percentage)
+        
+        potential_profit = bet_size * (odds - 1)
+        expected_value = (probability * potential_profit) - ((1 - probability) * bet_size)
+        return bet_size, potential_profit, expected_value
+    
     def calculate_risk_rating(self, market):
         """Calculate risk rating for a bet"""
         
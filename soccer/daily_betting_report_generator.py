@@ -18,6 +18,57 @@ import numpy as np
 import requests
 import json
 
+# Human-readable bet descriptions by market
+BET_DESCRIPTIONS = {
+    'Home': 'Home Team Win',
+    'Draw': 'Match Draw',
+    'Away': 'Away Team Win',
+    'Over 1.5': 'Over 1.5 Goals',
+    'Under 1.5': 'Under 1.5 Goals',
+    'Over 2.5': 'Over 2.5 Goals',
+    'Under 2.5': 'Under 2.5 Goals',
+    'Over 3.5': 'Over 3.5 Goals',
+    'Under 3.5': 'Under 3.5 Goals',
+    'BTTS Yes': 'Both Teams to Score - Yes',
+    'BTTS No': 'Both Teams to Score - No',
+    'Over 9.5 Corners': 'Over 9.5 Total Corners',
+    'Under 9.5 Corners': 'Under 9.5 Total Corners',
+    'Over 11.5 Corners': 'Over 11.5 Total Corners',
+    'Under 11.5 Corners': 'Under 11.5 Total Corners',
+    'Home/Draw': 'Home Win or Draw',
+    'Home/Away': 'Home Win or Away Win (No Draw)',
+    'Draw/Away': 'Draw or Away Win',
+    'Home Over 1.5': 'Home Team Over 1.5 Goals',
+    'Home Under 1.5': 'Home Team Under 1.5 Goals',
+    'Away Over 1.5': 'Away Team Over 1.5 Goals',
+    'Away Under 1.5': 'Away Team Under 1.5 Goals',
+    'Home +1': 'Home Team +1 Handicap',
+    'Away +1': 'Away Team +1 Handicap'
+}
+
+# Risk level by odds: <= 1.8 low, <= 3.0 medium, above that high
+RISK_ODDS_BINS = (1.8, 3.0)
+RISK_LEVELS = ('Low Risk', 'Medium Risk', 'High Risk')
+
+def _classify_market(market):
+    """Classify market category"""
+    if market in ['Home', 'Draw', 'Away']:
+        return 'Match Result'
+    elif 'Over' in market or 'Under' in market:
+        if 'Corner' in market:
+            return 'Corners'
+        else:
+            return 'Goals'
+    elif 'BTTS' in market:
+        return 'Both Teams to Score'
+    elif '/' in market:
+        return 'Double Chance'
+    else:
+        return 'Special'
+
+# Categories for every described market, classified once at import
+MARKET_CATEGORIES = {market: _classify_market(market) for market in BET_DESCRIPTIONS}
+
 class DailyBettingReportGenerator:
     """Generate daily betting reports with best picks"""
     
@@ -198,15 +249,16 @@ class DailyBettingReportGenerator:
             # Analyze all markets
             opportunities = self.predictor.analyze_all_markets(odds)
             
-            # Add match context to each opportunity
+            # Add match context to each opportunity (league name stripped once per match)
+            context = {
+                'kick_off': match['kick_off'],
+                'home_team': match['home_team'],
+                'away_team': match['away_team'],
+                'league': match['league'].strip(),
+                'country': match.get('country', 'Unknown')
+            }
             for opp in opportunities:
-                opp.update({
-                    'kick_off': match['kick_off'],
-                    'home_team': match['home_team'],
-                    'away_team': match['away_team'],
-                    'league': match['league'],
-                    'country': match.get('country', 'Unknown')
-                })
+                opp.update(context)
                 all_opportunities.append(opp)
         
         # Sort by expected value
@@ -559,58 +611,16 @@ class DailyBettingReportGenerator:
     
     def get_bet_description(self, market):
         """Get human-readable bet description"""
-        descriptions = {
-            'Home': 'Home Team Win',
-            'Draw': 'Match Draw', 
-            'Away': 'Away Team Win',
-            'Over 1.5': 'Over 1.5 Goals',
-            'Under 1.5': 'Under 1.5 Goals',
-            'Over 2.5': 'Over 2.5 Goals',
-            'Under 2.5': 'Under 2.5 Goals',
-            'Over 3.5': 'Over 3.5 Goals',
-            'Under 3.5': 'Under 3.5 Goals',
-            'BTTS Yes': 'Both Teams to Score - Yes',
-            'BTTS No': 'Both Teams to Score - No',
-            'Over 9.5 Corners': 'Over 9.5 Total Corners',
-            'Under 9.5 Corners': 'Under 9.5 Total Corners',
-            'Over 11.5 Corners': 'Over 11.5 Total Corners',
-            'Under 11.5 Corners': 'Under 11.5 Total Corners',
-            'Home/Draw': 'Home Win or Draw',
-            'Home/Away': 'Home Win or Away Win (No Draw)',
-            'Draw/Away': 'Draw or Away Win',
-            'Home Over 1.5': 'Home Team Over 1.5 Goals',
-            'Home Under 1.5': 'Home Team Under 1.5 Goals',
-            'Away Over 1.5': 'Away Team Over 1.5 Goals',
-            'Away Under 1.5': 'Away Team Under 1.5 Goals',
-            'Home +1': 'Home Team +1 Handicap',
-            'Away +1': 'Away Team +1 Handicap'
-        }
-        return descriptions.get(market, market)
+        return BET_DESCRIPTIONS.get(market, market)
     
     def get_risk_level(self, odds):
         """Classify risk level"""
-        if odds <= 1.8:
-            return 'Low Risk'
-        elif odds <= 3.0:
-            return 'Medium Risk'
-        else:
-            return 'High Risk'
+        return RISK_LEVELS[int(np.digitize(odds, RISK_ODDS_BINS, right=True))]
     
     def classify_market_category(self, market):
         """Classify market category"""
-        if market in ['Home', 'Draw', 'Away']:
-            return 'Match Result'
-        elif 'Over' in market or 'Under' in market:
-            if 'Corner' in market:
-                return 'Corners'
-            else:
-                return 'Goals'
-        elif 'BTTS' in market:
-            return 'Both Teams to Score'
-        elif '/' in market:
-            return 'Double Chance'
-        else:
-            return 'Special'
+        category = MARKET_CATEGORIES.get(market)
+        return category if category is not None else _classify_market(market)
 
 
 def main():
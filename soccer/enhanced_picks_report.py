@@ -8,6 +8,49 @@ import numpy as np
 from datetime import datetime
 import csv
 
+# Human-readable bet descriptions by market
+BET_DESCRIPTIONS = {
+    # Match Result
+    'Home': 'Home Team Win',
+    'Draw': 'Match Draw',
+    'Away': 'Away Team Win',
+    
+    # Goals Totals
+    'Over 1.5': 'Over 1.5 Goals in Match',
+    'Under 1.5': 'Under 1.5 Goals in Match',
+    'Over 2.5': 'Over 2.5 Goals in Match',
+    'Under 2.5': 'Under 2.5 Goals in Match',
+    'Over 3.5': 'Over 3.5 Goals in Match',
+    'Under 3.5': 'Under 3.5 Goals in Match',
+    
+    # Both Teams to Score
+    'BTTS Yes': 'Both Teams to Score - Yes',
+    'BTTS No': 'Both Teams to Score - No',
+    
+    # Team Totals
+    'Home Over 1.5': 'Home Team Over 1.5 Goals',
+    'Home Under 1.5': 'Home Team Under 1.5 Goals',
+    'Away Over 1.5': 'Away Team Over 1.5 Goals',
+    'Away Under 1.5': 'Away Team Under 1.5 Goals',
+    
+    # Double Chance
+    'Home/Draw': 'Home Win or Draw',
+    'Home/Away': 'Home Win or Away Win (No Draw)',
+    'Draw/Away': 'Draw or Away Win',
+    
+    # Corners
+    'Over 9.5 Corners': 'Over 9.5 Total Corners',
+    'Under 9.5 Corners': 'Under 9.5 Total Corners',
+    'Over 11.5 Corners': 'Over 11.5 Total Corners',
+    'Under 11.5 Corners': 'Under 11.5 Total Corners',
+    
+    # Asian Handicap
+    'Home -1': 'Home Team -1 Goal Handicap',
+    'Home +1': 'Home Team +1 Goal Handicap',
+    'Away -1': 'Away Team -1 Goal Handicap',
+    'Away +1': 'Away Team +1 Goal Handicap',
+}
+
 def create_enhanced_picks_report():
     """Create enhanced report with clear team names and bet descriptions"""
     
@@ -111,49 +154,7 @@ def parse_team_names(match_string):
 
 def get_bet_description(market):
     """Convert market code to human-readable description"""
-    descriptions = {
-        # Match Result
-        'Home': 'Home Team Win',
-        'Draw': 'Match Draw',
-        'Away': 'Away Team Win',
-        
-        # Goals Totals
-        'Over 1.5': 'Over 1.5 Goals in Match',
-        'Under 1.5': 'Under 1.5 Goals in Match',
-        'Over 2.5': 'Over 2.5 Goals in Match',
-        'Under 2.5': 'Under 2.5 Goals in Match',
-        'Over 3.5': 'Over 3.5 Goals in Match',
-        'Under 3.5': 'Under 3.5 Goals in Match',
-        
-        # Both Teams to Score
-        'BTTS Yes': 'Both Teams to Score - Yes',
-        'BTTS No': 'Both Teams to Score - No',
-        
-        # Team Totals
-        'Home Over 1.5': 'Home Team Over 1.5 Goals',
-        'Home Under 1.5': 'Home Team Under 1.5 Goals',
-        'Away Over 1.5': 'Away Team Over 1.5 Goals',  
-        'Away Under 1.5': 'Away Team Under 1.5 Goals',
-        
-        # Double Chance
-        'Home/Draw': 'Home Win or Draw',
-        'Home/Away': 'Home Win or Away Win (No Draw)',
-        'Draw/Away': 'Draw or Away Win',
-        
-        # Corners
-        'Over 9.5 Corners': 'Over 9.5 Total Corners',
-        'Under 9.5 Corners': 'Under 9.5 Total Corners',
-        'Over 11.5 Corners': 'Over 11.5 Total Corners',
-        'Under 11.5 Corners': 'Under 11.5 Total Corners',
-        
-        # Asian Handicap
-        'Home -1': 'Home Team -1 Goal Handicap',
-        'Home +1': 'Home Team +1 Goal Handicap',
-        'Away -1': 'Away Team -1 Goal Handicap',
-        'Away +1': 'Away Team +1 Goal Handicap',
-    }
-    
-    return descriptions.get(market, market)
+    return BET_DESCRIPTIONS.get(market, market)
 
 def classify_market_category(market):
     """Classify market into main categories"""
@@ -27,6 +27,47 @@ import joblib
 import logging
 
 
+# Betting market -> key of its odds in a generate_realistic_odds() dict
+MARKET_ODDS_KEYS = {
+    'Home': 'home_ml',
+    'Draw': 'draw_ml',
+    'Away': 'away_ml',
+    'Over 1.5': 'over_15',
+    'Under 1.5': 'under_15',
+    'Over 2.5': 'over_25',
+    'Under 2.5': 'under_25',
+    'Over 3.5': 'over_35',
+    'Under 3.5': 'under_35',
+    'BTTS Yes': 'btts_yes',
+    'BTTS No': 'btts_no',
+    'Home/Draw': 'home_draw',
+    'Home/Away': 'home_away',
+    'Draw/Away': 'draw_away',
+    'Home Over 1.5': 'home_over_15',
+    'Home Under 1.5': 'home_under_15',
+    'Away Over 1.5': 'away_over_15',
+    'Away Under 1.5': 'away_under_15',
+    'Over 9.5 Corners': 'over_95_corners',
+    'Under 9.5 Corners': 'under_95_corners',
+    'Over 11.5 Corners': 'over_115_corners',
+    'Under 11.5 Corners': 'under_115_corners',
+    'Home -1': 'home_minus1',
+    'Home +1': 'home_plus1',
+    'Away -1': 'away_minus1',
+    'Away +1': 'away_plus1'
+}
+
+def score_market_odds(probs, market_odds, kelly_multiplier, max_bet_fraction):
+    """Edge, expected value and capped Kelly stake for arrays of model probabilities and odds
+    
+    Edge relative to the implied probability, (p - 1/o) / (1/o), and the per-unit
+    expected value, p*(o-1) - (1-p), both reduce to p*o - 1, so it is computed once.
+    """
+    edges = probs * market_odds - 1
+    kelly_full = edges / (market_odds - 1)
+    kelly_adjusted = np.clip(kelly_full * kelly_multiplier, 0, max_bet_fraction)
+    return edges, edges, kelly_adjusted
+
 class MultiMarketPredictor:
     """Comprehensive multi-market soccer betting predictor"""
     
@@ -346,78 +387,67 @@ class MultiMarketPredictor:
     
     def analyze_all_markets(self, odds: dict) -> list:
         """Analyze all betting markets for value opportunities"""
+        return self.analyze_all_markets_batch([odds])[0]
+    
+    def analyze_all_markets_batch(self, odds_list: list) -> list:
+        """Analyze all betting markets for many matches at once
+        
+        Features for every match are scaled together and each market model is
+        called once on the whole matrix; edge/Kelly/EV are computed as array ops.
+        Returns one opportunity list per match (same order as odds_list).
+        """
         if not self.market_models:
             self.train_market_models(range(1000))  # Train with 1000 synthetic matches
         
-        features = self.create_market_features(odds)
-        X_scaled = self.scaler.transform([features])
-        
-        opportunities = []
-        
-        # Market-specific odds mapping
-        market_odds_map = {
-            'Home': odds['home_ml'],
-            'Draw': odds['draw_ml'], 
-            'Away': odds['away_ml'],
-            'Over 1.5': odds['over_15'],
-            'Under 1.5': odds['under_15'],
-            'Over 2.5': odds['over_25'],
-            'Under 2.5': odds['under_25'],
-            'Over 3.5': odds['over_35'],
-            'Under 3.5': odds['under_35'],
-            'BTTS Yes': odds['btts_yes'],
-            'BTTS No': odds['btts_no'],
-            'Home/Draw': odds['home_draw'],
-            'Home/Away': odds['home_away'],
-            'Draw/Away': odds['draw_away'],
-            'Home Over 1.5': odds['home_over_15'],
-            'Home Under 1.5': odds['home_under_15'],
-            'Away Over 1.5': odds['away_over_15'],
-            'Away Under 1.5': odds['away_under_15'],
-            'Over 9.5 Corners': odds['over_95_corners'],
-            'Under 9.5 Corners': odds['under_95_corners'],
-            'Over 11.5 Corners': odds['over_115_corners'],
-            'Under 11.5 Corners': odds['under_115_corners'],
-            'Home -1': odds['home_minus1'],
-            'Home +1': odds['home_plus1'],
-            'Away -1': odds['away_minus1'],
-            'Away +1': odds['away_plus1']
-        }
+        opportunities_per_match = [[] for _ in odds_list]
+        if not odds_list:
+            return opportunities_per_match
+        
+        features = np.array([self.create_market_features(odds) for odds in odds_list])
+        X_scaled = self.scaler.transform(features)
         
         for market, model in self.market_models.items():
-            if market in market_odds_map:
-                # Get model prediction
-                prob = model.predict_proba(X_scaled)[0][1]  # Probability of market hitting
-                market_odds = market_odds_map[market]
-                implied_prob = 1 / market_odds
-                
-                # Calculate edge
-                edge = (prob - implied_prob) / implied_prob
-                
-                # Check if this meets our criteria
-                if (edge > self.min_edge and 
-                    prob > self.min_confidence and 
-                    market_odds <= self.max_odds):
-                    
-                    # Calculate Kelly fraction
-                    kelly_full = (prob * market_odds - 1) / (market_odds - 1)
-                    kelly_adjusted = max(0, min(kelly_full * self.kelly_fraction, self.max_bet_fraction))
-                    
-                    if kelly_adjusted > 0.01:  # Minimum 1% bet
-                        opportunities.append({
-                            'market': market,
-                            'odds': market_odds,
-                            'model_probability': prob,
-                            'implied_probability': implied_prob,
-                            'edge': edge,
-                            'kelly_fraction': kelly_adjusted,
-                            'confidence': prob,
-                            'expected_value': prob * (market_odds - 1) - (1 - prob)
-                        })
-        
-        # Sort by expected value and return top opportunities
-        opportunities.sort(key=lambda x: x['expected_value'], reverse=True)
-        return opportunities[:5]  # Max 5 bets per match
+            odds_key = MARKET_ODDS_KEYS.get(market)
+            if odds_key is None:
+                continue
+            
+            # Model probability of the market hitting, per match
+            probs = model.predict_proba(X_scaled)[:, 1]
+            market_odds = np.array([odds[odds_key] for odds in odds_list], dtype=np.float64)
+            implied_probs = 1 / market_odds
+            
+            # Calculate edge, Kelly fraction and expected value for every match
+            edges, expected_values, kelly_adjusted = score_market_odds(
+                probs, market_odds, self.kelly_fraction, self.max_bet_fraction
+            )
+            
+            # Check which matches meet our criteria (minimum 1% bet)
+            selected = (
+                (edges > self.min_edge) &
+                (probs > self.min_confidence) &
+                (market_odds <= self.max_odds) &
+                (kelly_adjusted > 0.01)
+            )
+            
+            for i in np.flatnonzero(selected):
+                prob = float(probs[i])
+                opportunities_per_match[i].append({
+                    'market': market,
+                    'odds': odds_list[i][odds_key],
+                    'model_probability': prob,
+                    'implied_probability': float(implied_probs[i]),
+                    'edge': float(edges[i]),
+                    'kelly_fraction': float(kelly_adjusted[i]),
+                    'confidence': prob,
+                    'expected_value': float(expected_values[i])
+                })
+        
+        # Sort by expected value and keep the top opportunities
+        for i, opportunities in enumerate(opportunities_per_match):
+            opportunities.sort(key=lambda x: x['expected_value'], reverse=True)
+            opportunities_per_match[i] = opportunities[:5]  # Max 5 bets per match
+        
+        return opportunities_per_match
     
     def save_models(self, filepath: str):
         """Save all market models"""